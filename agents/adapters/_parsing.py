@@ -0,0 +1,25 @@
+"""Shared parsing helpers for LLM-backed persona adapters."""
+
+from __future__ import annotations
+
+import re
+from itertools import islice
+from typing import List
+
+# A plan step is a non-blank line; the match starts at its first non-space
+# character, so ``finditer`` skips blank lines and leading indentation in C.
+_STEP_LINE_RE = re.compile(r"\S[^\n]*")
+
+
+def plan_steps(content: str, limit: int) -> List[str]:
+    """Return up to ``limit`` stripped, non-blank lines of ``content``.
+
+    Scanning stops once ``limit`` steps are found, so long completions are not
+    split in full.
+    """
+
+    matches = islice(_STEP_LINE_RE.finditer(content), max(limit, 0))
+    return [match.group().rstrip() for match in matches]
+
+
+__all__ = ["plan_steps"]
@@ -6,6 +6,8 @@ from typing import Any, Dict, Optional
 
 from bench.core.types import Observation, Plan
 
+from ._parsing import plan_steps
+
 
 class OllamaAdapter:
     """Call Ollama's HTTP API to produce persona plans."""
@@ -44,8 +46,8 @@ class OllamaAdapter:
         response.raise_for_status()
         payload = response.json()
         content = payload.get("response", "")
-        steps = [line.strip() for line in content.split("\n") if line.strip()]
-        return Plan(rationale=content, steps=steps[: persona.get("planning_horizon", 3)])
+        steps = plan_steps(content, persona.get("planning_horizon", 3))
+        return Plan(rationale=content, steps=steps)
 
     def _format_prompt(self, persona: Dict[str, Any], observation: Observation) -> str:
         return (
@@ -6,6 +6,8 @@ from typing import Any, Dict, Iterable
 
 from bench.core.types import Observation, Plan
 
+from ._parsing import plan_steps
+
 
 class OpenAIChatAdapter:
     """Minimal wrapper calling an OpenAI-compatible chat completion endpoint."""
@@ -23,8 +25,8 @@ class OpenAIChatAdapter:
             temperature=persona.get("risk_tolerance", 0.5),
         )
         content = response.choices[0].message.content
-        steps = [line.strip() for line in content.split("\n") if line.strip()]
-        return Plan(rationale=content, steps=steps[: persona.get("planning_horizon", 3)])
+        steps = plan_steps(content, persona.get("planning_horizon", 3))
+        return Plan(rationale=content, steps=steps)
 
     def _build_prompt(self, persona: Dict[str, Any], observation: Observation) -> Iterable[Dict[str, str]]:
         return [
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from ...core.api import EnvAdapter
 from ...core.types import Action, Observation, StepResult
 
+# Ace (1) through King (13) of the single suit, copied into the stock on reset.
+_SUIT_CARDS = tuple(range(1, 14))
+
 
 @dataclass
 class TurnOutcome:
@@ -37,7 +40,7 @@ class SimpleSolitaireEnv:
         self._foundation: int = 0
 
     def reset(self) -> str:
-        self._stock = list(range(1, 14))
+        self._stock = list(_SUIT_CARDS)
         self._rng.shuffle(self._stock)
         self._waste = []
         self._foundation = 0
@@ -92,6 +95,22 @@ class SimpleSolitaireEnv:
         legal_moves = self._legal_moves()
         return TurnOutcome(description, reward, done, legal_moves, valid)
 
+    def draws_until_playable(self) -> Optional[int]:
+        """Return how many draws expose the next foundation card on the waste pile.
+
+        ``0`` means the waste card can already be played; ``None`` means drawing
+        alone will not reach it because the card is buried in the waste pile.
+        """
+
+        required = self._foundation + 1
+        if self._waste and self._waste[-1] == required:
+            return 0
+        try:
+            position = self._stock.index(required)
+        except ValueError:
+            return None
+        return len(self._stock) - position
+
     def _legal_moves(self) -> List[str]:
         moves: List[str] = []
         if self._stock:
@@ -139,6 +158,11 @@ class SolitaireAdapter(EnvAdapter):
         state = self._env.reset()
         return Observation(payload={"text": state})
 
+    def draws_until_playable(self) -> Optional[int]:
+        """Return the draws needed before ``play`` becomes legal (see the env helper)."""
+
+        return self._env.draws_until_playable()
+
     def execute(self, action: Action) -> StepResult:
         command = self._coerce_command(action)
         outcome = self._env.step(command)
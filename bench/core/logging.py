@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import json
+from collections import Counter
 from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import IO, Any, Callable, Dict, Mapping
 
 
+try:  # Optional speedup; the stdlib json module is the fallback.
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - exercised when the extra is absent
+    orjson = None  # type: ignore[assignment]
+
+
 class TraceJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects."""
     def default(self, obj):
@@ -19,6 +26,26 @@ class TraceJSONEncoder(json.JSONEncoder):
 from .types import Action, PersonaSignature, Plan, Reaction, StepResult
 
 
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_line(payload: Dict[str, Any]) -> str:
+    """Encode one trace record as a JSON line."""
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(payload, default=_orjson_default, option=option).decode("utf-8")
+    return json.dumps(payload, cls=TraceJSONEncoder) + "\n"
+
+
+def _tool_name(call: Any) -> Any:
+    if isinstance(call, Mapping):
+        return call.get("name")
+    return getattr(call, "name", None)
+
 
 class TraceLogger:
     """Writes persona traces to JSONL for auditability, with run context and tool usage summaries."""
@@ -44,7 +71,7 @@ class TraceLogger:
             for key, value in extra_context.items():
                 if value is not None:
                     self._context[key] = value
-        self._tool_usage: Dict[str, int] = {}
+        self._tool_usage: Counter[str] = Counter()
         self._event_sink = event_sink
 
     def log_context(self) -> None:
@@ -68,13 +95,9 @@ class TraceLogger:
 
     def log_action(self, agent: str, action: Action) -> None:
         # Track tool usage for summary
-        for call in getattr(action, "tool_calls", []):
-            if isinstance(call, Mapping):
-                name = call.get("name")
-            else:
-                name = getattr(call, "name", None)
-            if name:
-                self._tool_usage[name] = self._tool_usage.get(name, 0) + 1
+        self._tool_usage.update(
+            name for name in map(_tool_name, getattr(action, "tool_calls", [])) if name
+        )
 
         self._write(
             {
@@ -141,7 +164,7 @@ class TraceLogger:
     def _write(self, payload: Dict[str, Any]) -> None:
         if self._event_sink is not None:
             self._event_sink(dict(payload))
-        self._sink.write(json.dumps(payload, cls=TraceJSONEncoder) + "\n")
+        self._sink.write(_encode_line(payload))
 
     @classmethod
     def from_path(cls, path: Path, **kwargs) -> "TraceLogger":
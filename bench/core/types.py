@@ -9,7 +9,7 @@ def _utcnow() -> datetime:
     return datetime.now(UTC)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Observation:
     """Environment observation presented to the persona agent."""
 
@@ -17,7 +17,7 @@ class Observation:
     timestamp: datetime = field(default_factory=_utcnow)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Plan:
     """Structured plan a persona agent produces before acting."""
 
@@ -26,7 +26,7 @@ class Plan:
     metadata: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Action:
     """Concrete action issued to the environment."""
 
@@ -35,7 +35,7 @@ class Action:
     tool_calls: Sequence[Mapping[str, Any]] = field(default_factory=tuple)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Reaction:
     """Adjustment produced after observing environment feedback."""
 
@@ -44,7 +44,7 @@ class Reaction:
     metadata: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     """Auxiliary telemetry captured during rollouts."""
 
@@ -53,7 +53,7 @@ class Event:
     timestamp: datetime = field(default_factory=_utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Return value from environment adapters after applying an action."""
 
@@ -64,7 +64,7 @@ class StepResult:
     events: Iterable[Event] = field(default_factory=tuple)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersonaSignature:
     """Embedding-style signature used to track persona consistency."""
 
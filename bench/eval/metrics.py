@@ -4,7 +4,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from math import fsum, sqrt
-from typing import Mapping, Sequence
+from typing import Mapping, Optional, Sequence
+
+try:  # Optional speedup; the pure-Python reductions below are the fallback.
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - exercised when the extra is absent
+    np = None  # type: ignore[assignment]
+
+try:  # Optional JIT for callers that already hold contiguous ndarray buffers.
+    from numba import njit
+except ModuleNotFoundError:  # pragma: no cover - exercised when the extra is absent
+    njit = None
+
+# Below this many samples the array conversion costs more than the Python loop
+# saves, and ``fsum`` keeps small reward sums exactly rounded.
+_VECTORIZE_MIN_SIZE = 256
 
 
 @dataclass(frozen=True)
@@ -17,10 +31,60 @@ class MetricResult:
     breakdown: Mapping[str, float]
 
 
+if njit is not None:  # pragma: no cover - requires the optional numba extra
+
+    @njit(cache=True)
+    def _steps_over_kernel(actual, optimal):  # type: ignore[no-untyped-def]
+        total = 0.0
+        for index in range(actual.shape[0]):
+            delta = actual[index] - optimal[index]
+            if delta > 0.0:
+                total += delta
+        return total / actual.shape[0]
+
+    @njit(cache=True)
+    def _volatility_kernel(values):  # type: ignore[no-untyped-def]
+        size = values.shape[0]
+        mean = 0.0
+        for index in range(size):
+            mean += values[index]
+        mean /= size
+        variance = 0.0
+        for index in range(size):
+            delta = values[index] - mean
+            variance += delta * delta
+        return mean, (variance / size) ** 0.5
+
+else:
+    _steps_over_kernel = None
+    _volatility_kernel = None
+
+
+def _jit_buffers(*values: Sequence[object]) -> Optional[tuple]:
+    """Return float64 views for the JIT kernels when every input is a non-empty ndarray."""
+
+    if njit is None or not all(isinstance(value, np.ndarray) and len(value) for value in values):
+        return None
+    return tuple(np.ascontiguousarray(value, dtype=np.float64) for value in values)
+
+
+def _as_array(values: Sequence[object], dtype: type) -> Optional[np.ndarray]:
+    if np is None or len(values) < _VECTORIZE_MIN_SIZE:
+        return None
+    return np.asarray(values, dtype=dtype)
+
+
+def _count_true(values: Sequence[bool]) -> int:
+    array = _as_array(values, bool)
+    if array is not None:
+        return int(np.count_nonzero(array))
+    return sum(1 for value in values if value)
+
+
 def success_rate(outcomes: Sequence[bool]) -> MetricResult:
     """Compute the fraction of successful episodes."""
 
-    successes = sum(1 for outcome in outcomes if outcome)
+    successes = _count_true(outcomes)
     total = len(outcomes)
     value = successes / total if total else 0.0
     return MetricResult(
@@ -36,12 +100,20 @@ def steps_over_optimal(steps: Sequence[int], optimal_steps: Sequence[int]) -> Me
 
     if len(steps) != len(optimal_steps):
         raise ValueError("Steps and optimal_steps must be aligned")
-    deltas = [max(0, s - o) for s, o in zip(steps, optimal_steps)]
-    value = sum(deltas) / len(deltas) if deltas else 0.0
+    buffers = _jit_buffers(steps, optimal_steps)
+    steps_array = _as_array(steps, float) if buffers is None else None
+    if buffers is not None:
+        value = float(_steps_over_kernel(*buffers))
+    elif steps_array is not None:
+        deltas_array = np.maximum(steps_array - np.asarray(optimal_steps, dtype=float), 0.0)
+        value = float(deltas_array.mean())
+    else:
+        deltas = [max(0, s - o) for s, o in zip(steps, optimal_steps)]
+        value = sum(deltas) / len(deltas) if deltas else 0.0
     return MetricResult(
         name="steps_over_optimal",
         value=value,
-        sample_size=len(deltas),
+        sample_size=len(steps),
         breakdown={"mean_delta": value},
     )
 
@@ -49,13 +121,14 @@ def steps_over_optimal(steps: Sequence[int], optimal_steps: Sequence[int]) -> Me
 def compliance_rate(violations: Sequence[bool]) -> MetricResult:
     """Rate at which persona constraints are respected."""
 
-    safe = [not v for v in violations]
-    base = success_rate(safe)
+    total = len(violations)
+    safe = total - _count_true(violations)
+    value = safe / total if total else 0.0
     return MetricResult(
         name="compliance_rate",
-        value=base.value,
-        sample_size=base.sample_size,
-        breakdown=base.breakdown,
+        value=value,
+        sample_size=total,
+        breakdown={"successes": float(safe)},
     )
 
 
@@ -63,7 +136,8 @@ def expected_value(rewards: Sequence[float]) -> MetricResult:
     """Average reward across episodes."""
 
     total = len(rewards)
-    reward_sum = fsum(rewards)
+    array = _as_array(rewards, float)
+    reward_sum = float(array.sum()) if array is not None else fsum(rewards)
     value = reward_sum / total if total else 0.0
     return MetricResult(
         name="expected_value",
@@ -77,7 +151,7 @@ def cooperation_rate(decisions: Sequence[bool]) -> MetricResult:
     """Fraction of cooperative actions taken."""
 
     total = len(decisions)
-    cooperative = sum(1 for decision in decisions if decision)
+    cooperative = _count_true(decisions)
     value = cooperative / total if total else 0.0
     return MetricResult(
         name="cooperation_rate",
@@ -91,7 +165,7 @@ def red_flag_rate(flags: Sequence[bool]) -> MetricResult:
     """Rate at which red-flag violations were observed."""
 
     total = len(flags)
-    flagged = sum(1 for flag in flags if flag)
+    flagged = _count_true(flags)
     value = flagged / total if total else 0.0
     return MetricResult(
         name="red_flag_rate",
@@ -105,9 +179,16 @@ def volatility_penalty(rewards: Sequence[float]) -> MetricResult:
     """Population standard deviation of rewards, used as a volatility penalty."""
 
     total = len(rewards)
+    buffers = _jit_buffers(rewards)
+    array = _as_array(rewards, float) if buffers is None else None
     if total == 0:
         mean = 0.0
         stdev = 0.0
+    elif buffers is not None:
+        mean, stdev = (float(part) for part in _volatility_kernel(*buffers))
+    elif array is not None:
+        mean = float(array.mean())
+        stdev = float(array.std())
     else:
         mean = fsum(rewards) / total
         variance = fsum((reward - mean) ** 2 for reward in rewards) / total
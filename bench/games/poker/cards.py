@@ -11,11 +11,14 @@ RANK_VALUES = {rank: index + 2 for index, rank in enumerate(RANKS)}
 
 Card = Tuple[str, str]
 
+# Cards are immutable tuples, so every deck can start from one shared template.
+_DECK_TEMPLATE: Tuple[Card, ...] = tuple((rank, suit) for rank in RANKS for suit in SUITS)
+
 
 def build_deck() -> List[Card]:
     """Return a shuffled deck template (ordering handled by caller)."""
 
-    return [(rank, suit) for rank in RANKS for suit in SUITS]
+    return list(_DECK_TEMPLATE)
 
 
 def card_label(card: Card) -> str:
@@ -69,8 +69,13 @@ class HeadsUpPokerGame(TurnBasedGame):
         self._pot: float = 0.0
         self._history: List[str] = []
 
-    def reset(self) -> None:
-        self._rng = random.Random(self._seed)
+    def reset(self, seed: int | None = None) -> None:
+        """Deal a fresh hand; ``seed`` replaces the game's seed for later resets too."""
+
+        if seed is not None:
+            self._seed = seed
+        # Reseeding in place replays the same deals as a fresh ``Random(seed)``.
+        self._rng.seed(self._seed)
         deck = build_deck()
         self._rng.shuffle(deck)
 
@@ -3,37 +3,116 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from datetime import UTC, datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
 
 import yaml
 
+try:  # Optional speedup; the stdlib json module is the fallback.
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - exercised when the extra is absent
+    orjson = None  # type: ignore[assignment]
+
 ROOT = Path(__file__).resolve().parent.parent
-PERSONA_DIR = ROOT / "personas" / "examples"
-SCENARIO_DIR = ROOT / "scenarios"
+PERSONA_DIR_ENV = "PERSONABENCH_PERSONA_DIR"
+SCENARIO_DIR_ENV = "PERSONABENCH_SCENARIO_DIR"
+PERSONA_DIR = Path(os.environ.get(PERSONA_DIR_ENV) or ROOT / "personas" / "examples")
+SCENARIO_DIR = Path(os.environ.get(SCENARIO_DIR_ENV) or ROOT / "scenarios")
 GAME_DIR = ROOT / "games"
 
+# libyaml's C loader when PyYAML was built with it; same safe subset either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class CatalogError(RuntimeError):
     """Raised when catalog data cannot be loaded."""
 
 
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _write_json(path: Path, payload: Any, *, exclusive: bool = False) -> None:
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    _write_file(path, data + b"\n", exclusive=exclusive)
+
+
+def _write_file(path: Path, data: bytes, *, exclusive: bool = False) -> None:
+    # Catalog readers glob these directories, so a file only appears once complete.
+    # ``exclusive`` links instead of replacing, failing if ``path`` already exists.
+    staging = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    staging.write_bytes(data)
+    try:
+        if exclusive:
+            os.link(staging, path)
+        else:
+            os.replace(staging, path)
+    finally:
+        staging.unlink(missing_ok=True)
+
+
+def _read_yaml(path: Path) -> Any:
+    with path.open("r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=_YAML_LOADER)  # noqa: S506
+
+
+_FileStamp = Tuple[int, int, int]
+
+# ``path -> (stamp, parsed)`` from the last load of each directory, so a reload
+# after invalidation only re-parses files that were replaced or edited.
+_PERSONA_FILES: Dict[Path, Tuple[_FileStamp, Any]] = {}
+_SCENARIO_FILES: Dict[Path, Tuple[_FileStamp, Any]] = {}
+# Raw text of game manifests, rule packs and adapter sources served as assets.
+_ASSET_TEXT: Dict[Path, Tuple[_FileStamp, Any]] = {}
+
+
+def _parse_unless_unchanged(
+    path: Path,
+    previous: Dict[Path, Tuple[_FileStamp, Any]],
+    parse: Callable[[Path], Any],
+) -> Tuple[_FileStamp, Any]:
+    stat = path.stat()
+    # Writes land via rename, so the inode changes even if mtime and size do not.
+    stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = previous.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached
+    return stamp, parse(path)
+
+
+def _read_asset_text(path: Path) -> str:
+    entry = _parse_unless_unchanged(path, _ASSET_TEXT, lambda p: p.read_text(encoding="utf-8"))
+    _ASSET_TEXT[path] = entry
+    return entry[1]
+
+
 @lru_cache(maxsize=1)
 def _load_personas() -> Dict[str, Dict[str, Any]]:
     if not PERSONA_DIR.exists():
         raise CatalogError(f"Persona directory missing: {PERSONA_DIR}")
 
     personas: Dict[str, Dict[str, Any]] = {}
+    seen: Dict[Path, Tuple[_FileStamp, Any]] = {}
     for path in PERSONA_DIR.glob("*.json"):
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        seen[path] = _parse_unless_unchanged(path, _PERSONA_FILES, _read_json)
+        data = seen[path][1]
         name = data.get("name") or path.stem
         data = dict(data)
         data["_source_path"] = str(path)
         personas[name] = data
+    _PERSONA_FILES.clear()
+    _PERSONA_FILES.update(seen)
     return personas
 
 
@@ -61,9 +140,10 @@ def _load_scenarios() -> Dict[str, Dict[str, Any]]:
         raise CatalogError(f"Scenario directory missing: {SCENARIO_DIR}")
 
     scenarios: Dict[str, Dict[str, Any]] = {}
+    seen: Dict[Path, Tuple[_FileStamp, Any]] = {}
     for yaml_path in SCENARIO_DIR.rglob("*.yaml"):
-        with yaml_path.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle)
+        seen[yaml_path] = _parse_unless_unchanged(yaml_path, _SCENARIO_FILES, _read_yaml)
+        data = seen[yaml_path][1]
         scenario_id = data.get("id") or yaml_path.stem
         environment = yaml_path.parent.name
         metadata = data.get("metadata", {})
@@ -75,6 +155,8 @@ def _load_scenarios() -> Dict[str, Dict[str, Any]]:
             "raw": data,
             "path": str(yaml_path),
         }
+    _SCENARIO_FILES.clear()
+    _SCENARIO_FILES.update(seen)
     return scenarios
 
 
@@ -103,8 +185,7 @@ def _load_games() -> Dict[str, Dict[str, Any]]:
 
     games: Dict[str, Dict[str, Any]] = {}
     for yaml_path in GAME_DIR.rglob("*.yaml"):
-        with yaml_path.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle)
+        data = _read_yaml(yaml_path)
         game_id = data.get("id") or yaml_path.stem
         family = yaml_path.parent.name
         metadata = data.get("metadata", {})
@@ -180,11 +261,11 @@ def load_game_assets(game_id: str) -> Dict[str, Dict[str, Any]]:
     if not manifest_path.exists():
         raise CatalogError(f"Game manifest missing on disk: {manifest_path}")
 
-    manifest_content = manifest_path.read_text(encoding="utf-8")
+    manifest_content = _read_asset_text(manifest_path)
     rule_path = _resolve_rule_pack_path(manifest_path)
-    rule_content = rule_path.read_text(encoding="utf-8") if rule_path else None
+    rule_content = _read_asset_text(rule_path) if rule_path else None
     adapter_path = _resolve_adapter_path(entry)
-    adapter_content = adapter_path.read_text(encoding="utf-8") if adapter_path else None
+    adapter_content = _read_asset_text(adapter_path) if adapter_path else None
 
     payload: Dict[str, Dict[str, Any]] = {
         "manifest": {
@@ -274,8 +355,12 @@ def invalidate_scenario_cache() -> None:
     _load_scenarios.cache_clear()
 
 
-def save_persona(definition: Dict[str, Any]) -> Dict[str, Any]:
-    """Persist a persona definition to disk and refresh cache."""
+def save_persona(definition: Dict[str, Any], *, exclusive: bool = False) -> Dict[str, Any]:
+    """Persist a persona definition to disk and refresh cache.
+
+    With ``exclusive`` the file is created atomically and ``FileExistsError``
+    is raised if another writer got there first.
+    """
 
     if "name" not in definition:
         raise CatalogError("Persona definition missing 'name'")
@@ -285,8 +370,7 @@ def save_persona(definition: Dict[str, Any]) -> Dict[str, Any]:
 
     existing_metadata: Dict[str, Any] = {}
     if path.exists():
-        with path.open("r", encoding="utf-8") as handle:
-            existing_data = json.load(handle)
+        existing_data = _read_json(path)
         existing_metadata = existing_data.get("metadata", {}) if isinstance(existing_data, dict) else {}
 
     timestamp = datetime.now(UTC).isoformat()
@@ -305,16 +389,19 @@ def save_persona(definition: Dict[str, Any]) -> Dict[str, Any]:
     enriched = dict(definition)
     enriched["metadata"] = metadata
 
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(enriched, handle, indent=2, ensure_ascii=False)
-        handle.write("\n")
+    _write_json(path, enriched, exclusive=exclusive)
 
     invalidate_persona_cache()
     return get_persona(definition["name"])
 
 
-def save_scenario(definition: Dict[str, Any], *, environment: str) -> Dict[str, Any]:
-    """Persist a scenario definition under the specified environment."""
+def save_scenario(
+    definition: Dict[str, Any], *, environment: str, exclusive: bool = False
+) -> Dict[str, Any]:
+    """Persist a scenario definition under the specified environment.
+
+    ``exclusive`` behaves as in :func:`save_persona`.
+    """
 
     if "id" not in definition:
         raise CatalogError("Scenario definition missing 'id'")
@@ -323,8 +410,7 @@ def save_scenario(definition: Dict[str, Any], *, environment: str) -> Dict[str,
 
     existing_metadata: Dict[str, Any] = {}
     if path.exists():
-        with path.open("r", encoding="utf-8") as handle:
-            existing_data = yaml.safe_load(handle)
+        existing_data = _read_yaml(path)
         if isinstance(existing_data, dict):
             existing_metadata = existing_data.get("metadata", {}) or {}
 
@@ -346,8 +432,8 @@ def save_scenario(definition: Dict[str, Any], *, environment: str) -> Dict[str,
     enriched = dict(definition)
     enriched["metadata"] = metadata
 
-    with path.open("w", encoding="utf-8") as handle:
-        yaml.safe_dump(enriched, handle, sort_keys=False)
+    rendered = yaml.safe_dump(enriched, sort_keys=False)
+    _write_file(path, rendered.encode("utf-8"), exclusive=exclusive)
 
     invalidate_scenario_cache()
     return get_scenario(definition["id"])
@@ -3,19 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
-import json
 from datetime import UTC, datetime
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Tuple
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Request, Response, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.sse import EventSourceResponse
 
 from ..catalog import get_game, get_persona, get_scenario
 from ..chains import build_evaluation_chain
 from ..schemas import (
     EvaluationEventPayload,
+    EvaluationQueueCollection,
     EvaluationQueueEntry,
     EvaluationRequest,
     EvaluationResult,
@@ -24,6 +23,7 @@ from ..services.event_stream import get_event_stream
 from ..state import (
     enqueue_evaluation,
     get_queue_entry,
+    get_queue_entry_with_etag,
     list_queue_entries,
     summarize_queue,
 )
@@ -35,16 +35,18 @@ router = APIRouter(tags=["evaluations"])
 evaluation_chain = build_evaluation_chain()
 
 
-@router.get("/evaluations/queue")
-def get_evaluation_queue() -> Dict[str, object]:
+@router.get("/evaluations/queue", response_model=EvaluationQueueCollection)
+def get_evaluation_queue() -> EvaluationQueueCollection:
     """Return persisted evaluation queue entries plus summary statistics."""
 
     entries = list_queue_entries()
     summary = summarize_queue(entries)
-    return {
-        "entries": entries,
-        "summary": summary,
-    }
+    return EvaluationQueueCollection.model_validate(
+        {
+            "entries": entries,
+            "summary": summary,
+        }
+    )
 
 
 @router.get("/evaluations/queue/{entry_id}", response_model=EvaluationQueueEntry)
@@ -55,22 +57,24 @@ def get_evaluation_queue_entry(
 ) -> EvaluationQueueEntry | Response:
     """Return a single queue entry and support long-polling via ETag caching."""
 
-    entry = get_queue_entry(entry_id)
-    if entry is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Queue entry '{entry_id}' not found",
-        )
-
-    etag = _compute_etag(entry)
-    client_etags = _parse_client_etags(request.headers.get("if-none-match"))
-    if "*" in client_etags or etag in client_etags:
+    entry, etag = _load_queue_entry_with_etag(entry_id)
+    if _etag_matches(request, etag):
         return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
     response.headers["ETag"] = etag
     return EvaluationQueueEntry.model_validate(entry)
 
 
+@router.head("/evaluations/queue/{entry_id}")
+def head_evaluation_queue_entry(entry_id: str, request: Request) -> Response:
+    """Return the queue entry's ETag without serialising its body."""
+
+    _, etag = _load_queue_entry_with_etag(entry_id)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(status_code=status.HTTP_200_OK, headers={"ETag": etag})
+
+
 @router.post(
     "/evaluations",
     response_model=EvaluationResult,
@@ -172,38 +176,36 @@ def create_evaluation(request: EvaluationRequest) -> EvaluationResult:
     return EvaluationResult(status="queued", details=details)
 
 
-@router.get("/evaluations/queue/{entry_id}/events")
-async def stream_evaluation_events(entry_id: str) -> StreamingResponse:
-    """Stream evaluation lifecycle events via Server-Sent Events."""
-
-    entry = get_queue_entry(entry_id)
-    if entry is None:
+def _require_queue_entry(entry_id: str) -> str:
+    # Runs as a dependency so a missing entry is a 404 before the stream starts.
+    if get_queue_entry(entry_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Queue entry '{entry_id}' not found",
         )
+    return entry_id
 
-    async def event_generator():
-        loop = asyncio.get_running_loop()
-        queue, history = get_event_stream().subscribe(entry_id, loop)
-        try:
-            for item in history:
-                yield _encode_sse(item)
-            if history and history[-1].get("type") in {"result", "error"}:
-                return
-            while True:
-                event = await queue.get()
-                yield _encode_sse(event)
-                if event.get("type") in {"result", "error"}:
-                    break
-        finally:
-            get_event_stream().unsubscribe(entry_id, queue)
-
-    headers = {
-        "Cache-Control": "no-cache",
-        "X-Accel-Buffering": "no",
-    }
-    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=headers)
+
+@router.get("/evaluations/queue/{entry_id}/events", response_class=EventSourceResponse)
+async def stream_evaluation_events(
+    entry_id: str = Depends(_require_queue_entry),
+) -> AsyncIterator[EvaluationEventPayload]:
+    """Stream evaluation lifecycle events via Server-Sent Events."""
+
+    loop = asyncio.get_running_loop()
+    queue, history = get_event_stream().subscribe(entry_id, loop)
+    try:
+        for item in history:
+            yield item
+        if history and history[-1].get("type") in {"result", "error"}:
+            return
+        while True:
+            event = await queue.get()
+            yield event
+            if event.get("type") in {"result", "error"}:
+                break
+    finally:
+        get_event_stream().unsubscribe(entry_id, queue)
 
 
 @router.get(
@@ -223,10 +225,19 @@ def get_evaluation_event_history(entry_id: str) -> List[EvaluationEventPayload]:
     return [EvaluationEventPayload.model_validate(item) for item in events]
 
 
-def _compute_etag(entry: Dict[str, object]) -> str:
-    payload = json.dumps(entry, sort_keys=True, separators=(",", ":"))
-    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-    return f'W/"{digest}"'
+def _load_queue_entry_with_etag(entry_id: str) -> Tuple[Dict[str, object], str]:
+    found = get_queue_entry_with_etag(entry_id)
+    if found is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Queue entry '{entry_id}' not found",
+        )
+    return found
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    client_etags = _parse_client_etags(request.headers.get("if-none-match"))
+    return "*" in client_etags or etag in client_etags
 
 
 def _parse_client_etags(header_value: str | None) -> List[str]:
@@ -239,8 +250,3 @@ def _parse_client_etags(header_value: str | None) -> List[str]:
             continue
         normalized.append(token)
     return normalized
-
-
-def _encode_sse(event: Dict[str, object]) -> str:
-    payload = json.dumps(event, separators=(",", ":"))
-    return f"data: {payload}\n\n"
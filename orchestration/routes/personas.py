@@ -137,7 +137,14 @@ def create_persona(
             detail=f"Persona '{name}' already exists",
         )
 
-    saved = save_persona(definition)
+    try:
+        saved = save_persona(definition, exclusive=True)
+    except FileExistsError:
+        # A concurrent create won the race after the existence check above.
+        raise HTTPException(
+            status.HTTP_409_CONFLICT,
+            detail=f"Persona '{name}' already exists",
+        ) from None
     if saved is None:
         raise HTTPException(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -114,7 +114,14 @@ def create_scenario(
             detail=f"Scenario '{scenario_id}' already exists",
         )
 
-    saved = save_scenario(definition, environment=environment)
+    try:
+        saved = save_scenario(definition, environment=environment, exclusive=True)
+    except FileExistsError:
+        # A concurrent create won the race after the existence check above.
+        raise HTTPException(
+            status.HTTP_409_CONFLICT,
+            detail=f"Scenario '{scenario_id}' already exists",
+        ) from None
     if saved is None:
         raise HTTPException(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
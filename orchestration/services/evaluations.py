@@ -44,6 +44,8 @@ def execute_evaluation_job(job: EvaluationJobPayload) -> Dict[str, Any]:
         started_at=started_at,
         metadata={"run_id": job.run_id},
     )
+    # Publish before invoking the runner so subscribers always see ``running``
+    # ahead of the terminal event, however quickly the run finishes.
     _publish_status_event(job.queue_entry_id, "running", started_at)
 
     try:
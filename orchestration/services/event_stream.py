@@ -5,10 +5,12 @@ from __future__ import annotations
 import asyncio
 from asyncio import AbstractEventLoop, Queue as AsyncQueue
 from collections import deque
-from threading import Lock
-from typing import Any, Deque, Dict, List, Tuple
+from threading import Condition, Lock
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 _MAX_HISTORY = 50
+# Event types published once a job has finished, successfully or not.
+_TERMINAL_EVENT_TYPES = frozenset({"result", "error"})
 
 
 class EvaluationEventStream:
@@ -18,6 +20,7 @@ class EvaluationEventStream:
         self._subscribers: Dict[str, List[Tuple[AbstractEventLoop, AsyncQueue[Dict[str, Any]]]]] = {}
         self._history: Dict[str, Deque[Dict[str, Any]]] = {}
         self._lock = Lock()
+        self._published = Condition(self._lock)
 
     def publish(self, entry_id: str, event: Dict[str, Any]) -> None:
         """Record an event and fan it out to active subscribers."""
@@ -26,6 +29,7 @@ class EvaluationEventStream:
             history = self._history.setdefault(entry_id, deque(maxlen=_MAX_HISTORY))
             history.append(dict(event))
             subscribers = list(self._subscribers.get(entry_id, []))
+            self._published.notify_all()
 
         for loop, queue in subscribers:
             loop.call_soon_threadsafe(queue.put_nowait, dict(event))
@@ -55,6 +59,26 @@ class EvaluationEventStream:
             if not self._subscribers[entry_id]:
                 del self._subscribers[entry_id]
 
+    def wait_for_terminal(
+        self, entry_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Block until ``entry_id`` publishes a result or error event.
+
+        Returns a copy of that event, or ``None`` if ``timeout`` elapses first.
+        Events already in the history count, so callers may start waiting
+        after the job was submitted.
+        """
+
+        def _terminal() -> Optional[Dict[str, Any]]:
+            for event in reversed(self._history.get(entry_id, ())):
+                if event.get("type") in _TERMINAL_EVENT_TYPES:
+                    return event
+            return None
+
+        with self._published:
+            event = self._published.wait_for(_terminal, timeout=timeout)
+        return dict(event) if event is not None else None
+
     def reset(self) -> None:
         """Clear subscribers and history (used in tests)."""
 
@@ -5,23 +5,27 @@ from __future__ import annotations
 from .audit import list_audit_events, record_audit_event
 from .pairs import create_comparison_pair, get_comparison_pair, list_comparison_pairs
 from .queue import (
+    enqueue_and_finalize,
     enqueue_evaluation,
     get_queue_entry,
+    get_queue_entry_with_etag,
     list_queue_entries,
     summarize_queue,
     update_queue_entry,
 )
-from .repository import STATE_PATH, clear_state
+from .repository import STATE_DIR, clear_state
 from .responses import get_evaluation_response, list_evaluation_responses, record_evaluation_response
 from .votes import aggregate_comparison_votes, list_comparison_votes, record_comparison_vote
 
 __all__ = [
-    "STATE_PATH",
+    "STATE_DIR",
     "aggregate_comparison_votes",
     "clear_state",
     "create_comparison_pair",
+    "enqueue_and_finalize",
     "enqueue_evaluation",
     "get_queue_entry",
+    "get_queue_entry_with_etag",
     "get_comparison_pair",
     "get_evaluation_response",
     "list_audit_events",
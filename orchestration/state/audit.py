@@ -1,16 +1,54 @@
-"""Audit log persistence helpers."""
+"""Audit log persistence helpers.
 
-from __future__ import annotations
+Audit events are stored one canonical JSON object per line in
+``AUDIT_PATH``. Recording an event only queues its encoded line; a background
+writer appends queued lines in batches, and listing flushes the queue before
+reading the tail of the file. Every ``COLLECTION_LIMITS["audit"]`` appends the
+file is compacted down to the newest entries so it stays bounded.
 
-from dataclasses import asdict, dataclass, field
-from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+On first use, if ``AUDIT_PATH`` does not exist yet, the ``"audit"`` list of a
+legacy ``admin_state.json`` snapshot is copied into it so upgrades keep the
+existing trail.
+
+Set ``PERSONABENCH_AUDIT=0`` to disable persistence entirely (benchmarks,
+headless runs); events are then built and returned but never written.
+"""
 
-from .repository import STATE_LOCK, load_state, persist_state
-from .utils import normalize_metadata
+from __future__ import annotations
 
-_MAX_AUDIT_ENTRIES = 1000
+import atexit
+import json
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional
+
+from .repository import (
+    AUDIT_PATH,
+    COLLECTION_LIMITS,
+    LEGACY_STATE_PATH,
+    _dumps,
+    _loads,
+    _read_json,
+)
+from .utils import new_id, normalize_metadata
+
+AUDIT_ENV = "PERSONABENCH_AUDIT"
+_AUDIT_ENABLED = os.environ.get(AUDIT_ENV, "1") == "1"
+
+_AUDIT_LOCK = Lock()
+_TAIL_CHUNK_SIZE = 8192
+_APPENDS_SINCE_COMPACTION = 0
+_FLUSH_INTERVAL_SECONDS = 0.1
+_FLUSH_BATCH_SIZE = 100
+
+_PENDING_LINES: Deque[bytes] = deque()
+_FLUSH_REQUESTED = threading.Event()
+_WRITER_THREAD: Optional[threading.Thread] = None
+_LEGACY_CHECKED = False
 
 
 @dataclass(slots=True)
@@ -26,15 +64,144 @@ class AuditEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def _serialize_audit_event(entry: AuditEvent) -> Dict[str, Any]:
+    return {
+        "id": entry.id,
+        "timestamp": entry.timestamp,
+        "actor": entry.actor,
+        "action": entry.action,
+        "subject": entry.subject,
+        "status": entry.status,
+        "metadata": entry.metadata,
+    }
+
+
+def _tail_lines(count: int) -> List[bytes]:
+    """Return up to ``count`` trailing non-empty lines of the audit file."""
+
+    if count <= 0:
+        return []
+    try:
+        handle = AUDIT_PATH.open("rb")
+    except FileNotFoundError:
+        return []
+
+    with handle:
+        position = os.fstat(handle.fileno()).st_size
+        buffer = b""
+        while position > 0 and buffer.count(b"\n") <= count:
+            step = min(_TAIL_CHUNK_SIZE, position)
+            position -= step
+            handle.seek(position)
+            buffer = handle.read(step) + buffer
+
+    lines = buffer.split(b"\n")
+    if position > 0:
+        # The first fragment may start mid-line; enough whole lines follow it.
+        lines = lines[1:]
+    return [line for line in lines if line.strip()][-count:]
+
+
+def _read_tail(count: int) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = []
+    for line in _tail_lines(count):
+        try:
+            event = _loads(line)
+        except json.JSONDecodeError:
+            # A torn write from a crash; skip it rather than failing the listing.
+            continue
+        if isinstance(event, dict):
+            events.append(event)
+    return events
+
+
+def _compact_audit_log(keep: int) -> None:
+    """Rewrite the audit file with only its newest ``keep`` lines."""
+
+    lines = _tail_lines(keep)
+    tmp_path = AUDIT_PATH.with_suffix(".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(b"".join(line + b"\n" for line in lines))
+    tmp_path.replace(AUDIT_PATH)
+
+
+def _migrate_legacy_audit() -> None:
+    """Seed ``AUDIT_PATH`` from a legacy snapshot's audit list (once per process)."""
+
+    global _LEGACY_CHECKED
+
+    _LEGACY_CHECKED = True
+    if AUDIT_PATH.exists():
+        return
+    legacy = _read_json(LEGACY_STATE_PATH)
+    entries = legacy.get("audit") if legacy is not None else None
+    if not isinstance(entries, list):
+        return
+    lines = [_dumps(entry) + b"\n" for entry in entries if isinstance(entry, dict)]
+    if not lines:
+        return
+    AUDIT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with AUDIT_PATH.open("xb") as handle:
+        handle.write(b"".join(lines[-COLLECTION_LIMITS["audit"] :]))
+
+
+def flush_audit_events() -> None:
+    """Append every queued audit line to ``AUDIT_PATH`` in one write."""
+
+    global _APPENDS_SINCE_COMPACTION
+
+    with _AUDIT_LOCK:
+        if not _LEGACY_CHECKED:
+            # Before the first append, so migrated events stay oldest.
+            _migrate_legacy_audit()
+        # Lines are popped under the lock so concurrent flushes keep their order.
+        batch: List[bytes] = []
+        while _PENDING_LINES:
+            batch.append(_PENDING_LINES.popleft())
+        if not batch:
+            return
+
+        AUDIT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with AUDIT_PATH.open("ab") as handle:
+            handle.write(b"".join(batch))
+        _APPENDS_SINCE_COMPACTION += len(batch)
+        cap = COLLECTION_LIMITS["audit"]
+        if _APPENDS_SINCE_COMPACTION >= cap:
+            _compact_audit_log(cap)
+            _APPENDS_SINCE_COMPACTION = 0
+
+
+def _discard_pending() -> None:
+    global _LEGACY_CHECKED
+
+    with _AUDIT_LOCK:
+        _PENDING_LINES.clear()
+        _LEGACY_CHECKED = False
+
+
+def _writer_loop() -> None:
+    while True:
+        _FLUSH_REQUESTED.wait(_FLUSH_INTERVAL_SECONDS)
+        _FLUSH_REQUESTED.clear()
+        flush_audit_events()
+
+
+def _ensure_writer_thread() -> None:
+    global _WRITER_THREAD
+    if _WRITER_THREAD is None or not _WRITER_THREAD.is_alive():
+        _WRITER_THREAD = threading.Thread(target=_writer_loop, name="audit-writer", daemon=True)
+        _WRITER_THREAD.start()
+
+
+atexit.register(flush_audit_events)
+
+
 def list_audit_events(*, limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """Return recorded audit events (ordered oldest→newest)."""
 
-    with STATE_LOCK:
-        state = load_state()
-        events: List[Dict[str, Any]] = list(state.get("audit", []))
-        if limit is not None:
-            return events[-limit:]
-        return events
+    flush_audit_events()
+    cap = COLLECTION_LIMITS["audit"]
+    return _read_tail(cap if limit is None else min(limit, cap))
 
 
 def record_audit_event(
@@ -47,10 +214,10 @@ def record_audit_event(
     metadata: Optional[Dict[str, Any]] = None,
     event_id: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Persist an audit event in the service log."""
+    """Queue an audit event for the service log and return it."""
 
     entry = AuditEvent(
-        id=event_id or str(uuid4()),
+        id=event_id or new_id(),
         timestamp=(timestamp or datetime.now(UTC).isoformat()),
         actor=actor,
         action=action,
@@ -59,16 +226,14 @@ def record_audit_event(
         metadata=normalize_metadata(metadata),
     )
 
-    with STATE_LOCK:
-        state = load_state()
-        events: List[Dict[str, Any]] = list(state.get("audit", []))
-        events.append(asdict(entry))
-        if len(events) > _MAX_AUDIT_ENTRIES:
-            events = events[-_MAX_AUDIT_ENTRIES:]
+    if not _AUDIT_ENABLED:
+        return _serialize_audit_event(entry)
 
-        state["audit"] = events
-        persist_state(state)
+    _PENDING_LINES.append(_dumps(_serialize_audit_event(entry)) + b"\n")
+    _ensure_writer_thread()
+    if len(_PENDING_LINES) >= _FLUSH_BATCH_SIZE:
+        _FLUSH_REQUESTED.set()
 
-    return asdict(entry)
+    return _serialize_audit_event(entry)
 
-__all__ = ["list_audit_events", "record_audit_event"]
+__all__ = ["flush_audit_events", "list_audit_events", "record_audit_event"]
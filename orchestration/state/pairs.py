@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-import copy
 import secrets
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Dict, Iterable, List, MutableMapping, Optional
-from uuid import uuid4
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .repository import STATE_LOCK, load_state, persist_state
-from .utils import normalize_metadata, sanitize_metadata
+from .repository import (
+    append_record,
+    collection_index,
+    grouped_entries,
+    load_collection,
+    lookup_entry,
+    state_lock,
+    sync_records,
+)
+from .utils import new_id, normalize_metadata, sanitize_metadata
 
-_MAX_PAIR_ENTRIES = 500
+_SLOT_ORDERS = (("A", "B"), ("B", "A"))
 
 
 @dataclass(slots=True)
@@ -39,12 +45,29 @@ class ComparisonPair:
 
 
 def _serialize_pair(pair: ComparisonPair) -> Dict[str, Any]:
-    return asdict(pair)
+    return {
+        "id": pair.id,
+        "target_id": pair.target_id,
+        "target_kind": pair.target_kind,
+        "created_at": pair.created_at,
+        "adapter": pair.adapter,
+        "responses": [
+            {
+                "response_id": assignment.response_id,
+                "persona_id": assignment.persona_id,
+                "slot": assignment.slot,
+            }
+            for assignment in pair.responses
+        ],
+        "metadata": pair.metadata,
+        "status": pair.status,
+    }
 
 
 def _anonymized_pair_payload(
     pair_record: Dict[str, Any],
     responses_index: Dict[str, Dict[str, Any]],
+    metadata_cache: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     responses_payload: List[Dict[str, Any]] = []
     for assignment in pair_record.get("responses", []):
@@ -56,15 +79,23 @@ def _anonymized_pair_payload(
         if not source:
             continue
 
-        metadata = sanitize_metadata(source.get("metadata"))
+        if metadata_cache is None:
+            metadata = sanitize_metadata(source.get("metadata"))
+        else:
+            # A response can sit in several listed pairs; sanitise it once.
+            metadata = metadata_cache.get(response_id)
+            if metadata is None:
+                metadata = metadata_cache[response_id] = sanitize_metadata(source.get("metadata"))
         response_entry = {
             "slot": slot,
             "response_id": response_id,
             "recorded_at": source.get("created_at"),
             "adapter": source.get("adapter"),
-            "summary": copy.deepcopy(source.get("summary", {})),
-            "steps": copy.deepcopy(source.get("steps", [])),
-            "trace": copy.deepcopy(source.get("trace", [])),
+            # Stored responses are append-only, so nested payloads are shared
+            # read-only rather than deep-copied for every listing.
+            "summary": source.get("summary", {}),
+            "steps": source.get("steps", []),
+            "trace": source.get("trace", []),
             "metadata": metadata,
         }
         responses_payload.append(response_entry)
@@ -93,36 +124,61 @@ def _anonymized_pair_payload(
 def list_comparison_pairs(*, limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """Return anonymised comparison pairs for reviewer listings."""
 
-    with STATE_LOCK:
-        state = load_state()
-        pairs_raw: List[Dict[str, Any]] = [dict(entry) for entry in state.get("pairs", [])]
-        responses_index = {
-            entry.get("id"): dict(entry)
-            for entry in state.get("responses", [])
-            if isinstance(entry, MutableMapping) and entry.get("id")
-        }
-
-    if limit is not None:
-        pairs_raw = pairs_raw[-limit:]
+    with state_lock("responses", "pairs"):
+        pairs_raw: List[Dict[str, Any]] = list(load_collection("pairs"))
+        if limit is not None:
+            pairs_raw = pairs_raw[-limit:]
+        pairs_raw.reverse()
 
-    pairs_raw.reverse()
-    return [_anonymized_pair_payload(pair, responses_index) for pair in pairs_raw]
+        responses_index = collection_index("responses")
+        metadata_cache: Dict[str, Dict[str, Any]] = {}
+        return [
+            _anonymized_pair_payload(pair, responses_index, metadata_cache)
+            for pair in pairs_raw
+        ]
 
 
 def get_comparison_pair(pair_id: str) -> Optional[Dict[str, Any]]:
     """Return a specific anonymised comparison pair by identifier."""
 
-    with STATE_LOCK:
-        state = load_state()
-        responses_index = {
-            entry.get("id"): dict(entry)
-            for entry in state.get("responses", [])
-            if isinstance(entry, MutableMapping) and entry.get("id")
-        }
-        for payload in reversed(state.get("pairs", [])):
-            if payload.get("id") == pair_id:
-                return _anonymized_pair_payload(dict(payload), responses_index)
-    return None
+    with state_lock("responses", "pairs"):
+        payload = lookup_entry("pairs", pair_id)
+        if payload is None:
+            return None
+        return _anonymized_pair_payload(payload, collection_index("responses"))
+
+
+def _select_pair(
+    eligible: List[Dict[str, Any]],
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Pick the newest response that has a partner from another persona.
+
+    ``eligible`` is ordered newest first. Responses are bucketed by target in a
+    single pass; each bucket's anchor is its newest response and its partner is
+    the next response in that bucket from a different persona.
+    """
+
+    anchors: Dict[Tuple[Any, Any], Tuple[int, Dict[str, Any]]] = {}
+    best: Optional[Tuple[int, Dict[str, Any], Dict[str, Any]]] = None
+    for rank, entry in enumerate(eligible):
+        key = (entry.get("target_id"), entry.get("target_kind"))
+        anchored = anchors.get(key)
+        if anchored is None:
+            anchors[key] = (rank, entry)
+            continue
+        anchor_rank, anchor = anchored
+        if anchor_rank < 0 or entry.get("persona_id") == anchor.get("persona_id"):
+            continue
+        if entry.get("id") == anchor.get("id"):
+            continue
+        # Bucket resolved; mark it so later entries skip it.
+        anchors[key] = (-1, anchor)
+        if best is None or anchor_rank < best[0]:
+            best = (anchor_rank, anchor, entry)
+
+    if best is None:
+        return None
+    return best[1], best[2]
 
 
 def create_comparison_pair(
@@ -136,47 +192,20 @@ def create_comparison_pair(
 
     exclude_ids = {response_id for response_id in (exclude_responses or [])}
 
-    with STATE_LOCK:
-        state = load_state()
-        responses: List[Dict[str, Any]] = [dict(entry) for entry in state.get("responses", [])]
-
-        eligible: List[Dict[str, Any]] = []
-        for entry in responses:
-            if status and entry.get("status") != status:
-                continue
-            if target_id and entry.get("target_id") != target_id:
-                continue
-            if target_kind and entry.get("target_kind") != target_kind:
-                continue
-            if entry.get("id") in exclude_ids:
-                continue
-            eligible.append(entry)
+    with state_lock("responses", "pairs"):
+        candidates = grouped_entries(
+            "responses", target_id or None, target_kind or None, status or None
+        )
+        eligible = [entry for entry in candidates if entry.get("id") not in exclude_ids]
 
         eligible.sort(key=lambda item: item.get("created_at", ""), reverse=True)
 
-        chosen_pair: Optional[tuple[Dict[str, Any], Dict[str, Any]]] = None
-        for index, first in enumerate(eligible):
-            for second in eligible[index + 1 :]:
-                if first.get("id") == second.get("id"):
-                    continue
-                if first.get("persona_id") == second.get("persona_id"):
-                    continue
-                if first.get("target_id") != second.get("target_id"):
-                    continue
-                if target_kind and second.get("target_kind") != target_kind:
-                    continue
-                chosen_pair = (first, second)
-                break
-            if chosen_pair:
-                break
-
+        chosen_pair = _select_pair(eligible)
         if chosen_pair is None:
             raise ValueError("No eligible evaluation responses available for pairing")
 
         first, second = chosen_pair
-        slots = ["A", "B"]
-        if secrets.randbelow(2):
-            slots.reverse()
+        slots = secrets.choice(_SLOT_ORDERS)
 
         target_title = (
             first.get("metadata", {}).get("target_title")
@@ -188,7 +217,7 @@ def create_comparison_pair(
             pair_metadata["target_title"] = target_title
 
         pair_record = ComparisonPair(
-            id=str(uuid4()),
+            id=new_id(),
             target_id=first.get("target_id", target_id or ""),
             target_kind=first.get("target_kind", target_kind or "scenario"),
             created_at=datetime.now(UTC).isoformat(),
@@ -208,16 +237,12 @@ def create_comparison_pair(
             metadata=normalize_metadata(pair_metadata),
         )
 
-        pairs: List[Dict[str, Any]] = list(state.get("pairs", []))
         serialized_pair = _serialize_pair(pair_record)
-        pairs.append(serialized_pair)
-        if len(pairs) > _MAX_PAIR_ENTRIES:
-            pairs = pairs[-_MAX_PAIR_ENTRIES:]
-        state["pairs"] = pairs
-
-        responses_index = {entry["id"]: entry for entry in responses if entry.get("id")}
-        pair_payload = _anonymized_pair_payload(serialized_pair, responses_index)
-        persist_state(state)
+        marker = append_record("pairs", "append", serialized_pair)
+
+        pair_payload = _anonymized_pair_payload(serialized_pair, collection_index("responses"))
+
+    sync_records("pairs", marker)
 
     return pair_payload
 
@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import copy
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Dict, List, MutableMapping, Optional
-from uuid import uuid4
-
-from .repository import STATE_LOCK, load_state, persist_state
-from .utils import normalize_metadata, parse_timestamp
-
-_MAX_QUEUE_ENTRIES = 500
+from hashlib import blake2b
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple
+
+from .repository import (
+    COLLECTION_LIMITS,
+    _dumps,
+    append_record,
+    collection_index,
+    load_collection,
+    lookup_entry,
+    state_lock,
+    sync_records,
+)
+from .utils import new_id, normalize_metadata, parse_timestamp
+
+# ``entry id -> ETag`` for entries served since their last change; guarded by
+# the queue lock and dropped whenever the entry is written.
+_ETAGS: Dict[str, str] = {}
 
 
 @dataclass(slots=True)
@@ -31,31 +43,66 @@ class EvaluationQueueEntry:
 
 
 def _serialize_queue_entry(entry: EvaluationQueueEntry) -> Dict[str, Any]:
-    return asdict(entry)
+    # Direct field reads; ``dataclasses.asdict`` would deep-copy config/metadata.
+    return {
+        "id": entry.id,
+        "persona_id": entry.persona_id,
+        "target_id": entry.target_id,
+        "target_kind": entry.target_kind,
+        "status": entry.status,
+        "requested_at": entry.requested_at,
+        "config": entry.config,
+        "started_at": entry.started_at,
+        "completed_at": entry.completed_at,
+        "error": entry.error,
+        "metadata": entry.metadata,
+    }
 
 
 def list_queue_entries(*, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-    """Return recorded evaluation queue entries (ordered oldest→newest)."""
+    """Return recorded evaluation queue entries (ordered oldest→newest).
+
+    Entries are shared with the in-memory cache and must be treated as
+    read-only; updates replace them rather than editing them.
+    """
 
-    with STATE_LOCK:
-        state = load_state()
-        queue: List[Dict[str, Any]] = list(state.get("queue", []))
-        if limit is not None:
-            return queue[-limit:]
-        return queue
+    with state_lock("queue"):
+        queue: List[Dict[str, Any]] = list(load_collection("queue"))
+    if limit is not None:
+        queue = queue[-limit:]
+    return queue
 
 
 def get_queue_entry(entry_id: str) -> Optional[Dict[str, Any]]:
     """Return a single evaluation queue entry by identifier."""
 
-    with STATE_LOCK:
-        state = load_state()
-        queue: List[Dict[str, Any]] = list(state.get("queue", []))
+    with state_lock("queue"):
+        payload = lookup_entry("queue", entry_id)
+        return copy.deepcopy(payload) if payload is not None else None
+
 
-    for payload in reversed(queue):
-        if payload.get("id") == entry_id:
-            return dict(payload)
-    return None
+def get_queue_entry_with_etag(entry_id: str) -> Optional[Tuple[Dict[str, Any], str]]:
+    """Return a queue entry together with a validator for its current content.
+
+    The ETag is hashed once per version of the entry and reused until the next
+    write, so conditional GETs skip re-serialising unchanged entries.
+    """
+
+    with state_lock("queue"):
+        payload = lookup_entry("queue", entry_id)
+        if payload is None:
+            _ETAGS.pop(entry_id, None)
+            return None
+        etag = _ETAGS.get(entry_id)
+        if etag is None:
+            etag = f'W/"{blake2b(_dumps(payload), digest_size=16).hexdigest()}"'
+            if len(_ETAGS) >= COLLECTION_LIMITS["queue"]:
+                # Forget validators of evicted entries.
+                live = collection_index("queue")
+                for stale in [key for key in _ETAGS if key not in live]:
+                    del _ETAGS[stale]
+            _ETAGS[entry_id] = etag
+        return copy.deepcopy(payload), etag
 
 
 def enqueue_evaluation(
@@ -72,7 +119,7 @@ def enqueue_evaluation(
     """Record an evaluation request in the persistent queue."""
 
     entry = EvaluationQueueEntry(
-        id=entry_id or str(uuid4()),
+        id=entry_id or new_id(),
         persona_id=persona_id,
         target_id=target_id,
         target_kind=target_kind,
@@ -81,17 +128,51 @@ def enqueue_evaluation(
         config=dict(config or {}),
         metadata=normalize_metadata(metadata),
     )
+    return _append_queue_entry(entry)
+
+
+def enqueue_and_finalize(
+    *,
+    persona_id: str,
+    target_id: str,
+    target_kind: str,
+    status: str = "completed",
+    requested_at: Optional[str] = None,
+    started_at: Optional[str] = None,
+    completed_at: Optional[str] = None,
+    error: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    entry_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Record an evaluation that already ran, lifecycle fields included.
 
-    with STATE_LOCK:
-        state = load_state()
-        queue: List[Dict[str, Any]] = list(state.get("queue", []))
+    Equivalent to :func:`enqueue_evaluation` followed by the ``running`` and
+    terminal :func:`update_queue_entry` calls, but written as a single log
+    record under one lock acquisition (imports, fixtures, replays).
+    """
 
-        queue.append(_serialize_queue_entry(entry))
-        if len(queue) > _MAX_QUEUE_ENTRIES:
-            queue = queue[-_MAX_QUEUE_ENTRIES:]
+    entry = EvaluationQueueEntry(
+        id=entry_id or new_id(),
+        persona_id=persona_id,
+        target_id=target_id,
+        target_kind=target_kind,
+        status=status,
+        requested_at=(requested_at or datetime.now(UTC).isoformat()),
+        config=dict(config or {}),
+        started_at=started_at,
+        completed_at=completed_at,
+        error=error,
+        metadata=normalize_metadata(metadata),
+    )
+    return _append_queue_entry(entry)
 
-        state["queue"] = queue
-        persist_state(state)
+
+def _append_queue_entry(entry: EvaluationQueueEntry) -> Dict[str, Any]:
+    with state_lock("queue"):
+        _ETAGS.pop(entry.id, None)
+        marker = append_record("queue", "append", _serialize_queue_entry(entry))
+    sync_records("queue", marker)
 
     return _serialize_queue_entry(entry)
 
@@ -107,35 +188,34 @@ def update_queue_entry(
 ) -> Dict[str, Any]:
     """Update an existing queue entry and persist the modification."""
 
-    with STATE_LOCK:
-        state = load_state()
-        queue: List[Dict[str, Any]] = list(state.get("queue", []))
-        for index, payload in enumerate(queue):
-            if payload.get("id") != entry_id:
-                continue
-
-            if status is not None:
-                payload["status"] = status
-            if started_at is not None:
-                payload["started_at"] = started_at
-            if completed_at is not None:
-                payload["completed_at"] = completed_at
-            if error is not None:
-                payload["error"] = error
-            if metadata is not None:
-                payload.setdefault("metadata", {})
-                existing = payload["metadata"]
-                if isinstance(existing, MutableMapping):
-                    existing.update(normalize_metadata(metadata))
-                else:
-                    payload["metadata"] = normalize_metadata(metadata)
-
-            queue[index] = dict(payload)
-            state["queue"] = queue
-            persist_state(state)
-            return dict(payload)
-
-    raise KeyError(f"Queue entry '{entry_id}' not found")
+    with state_lock("queue"):
+        payload = lookup_entry("queue", entry_id)
+        if payload is None:
+            raise KeyError(f"Queue entry '{entry_id}' not found")
+
+        changes: Dict[str, Any] = {}
+        if status is not None:
+            changes["status"] = status
+        if started_at is not None:
+            changes["started_at"] = started_at
+        if completed_at is not None:
+            changes["completed_at"] = completed_at
+        if error is not None:
+            changes["error"] = error
+        if metadata is not None:
+            existing = payload.get("metadata")
+            merged = dict(existing) if isinstance(existing, MutableMapping) else {}
+            merged.update(normalize_metadata(metadata))
+            changes["metadata"] = merged
+
+        # The cache swaps in its own copy, so listings never see a half-applied
+        # update; ``updated`` stays private to the caller.
+        updated = {**payload, **changes}
+        marker = append_record("queue", "update", updated)
+        _ETAGS.pop(entry_id, None)
+
+    sync_records("queue", marker)
+    return updated
 
 
 def summarize_queue(entries: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
@@ -157,44 +237,48 @@ def summarize_queue(entries: Optional[List[Dict[str, Any]]] = None) -> Dict[str,
 
     now = datetime.now(UTC)
 
-    for entry in entries:
+    # Newest-first walk for the counts: the first completed entry seen is the
+    # latest, so only its timestamps are parsed.
+    for entry in reversed(entries):
         status = entry.get("status")
         if status == "queued":
             queued += 1
-            if oldest_queued_entry is None:
-                ts = parse_timestamp(entry.get("requested_at"))
-                if ts is not None:
-                    oldest_queued_entry = entry
-                    oldest_queued_at = ts
         elif status == "running":
             running += 1
         elif status == "completed":
             completed += 1
-        elif status == "failed":
-            failed += 1
-
-    for entry in reversed(entries):
-        if entry.get("status") != "completed":
-            continue
+            if latest_completed_entry is not None:
+                continue
+            completed_ts = parse_timestamp(entry.get("completed_at"))
+            if completed_ts is None:
+                continue
 
-        completed_ts = parse_timestamp(entry.get("completed_at"))
-        if completed_ts is None:
-            continue
+            latest_completed_entry = entry
+            latest_completed_at = completed_ts
 
-        latest_completed_entry = entry
-        latest_completed_at = completed_ts
+            started_ts = parse_timestamp(entry.get("started_at"))
+            if started_ts is not None:
+                latest_completed_duration = (completed_ts - started_ts).total_seconds()
+        elif status == "failed":
+            failed += 1
 
-        started_ts = parse_timestamp(entry.get("started_at"))
-        if started_ts is not None:
-            latest_completed_duration = (completed_ts - started_ts).total_seconds()
-        break
+    if queued:
+        # The oldest queued entry sits near the front; stop at the first parseable one.
+        for entry in entries:
+            if entry.get("status") != "queued":
+                continue
+            ts = parse_timestamp(entry.get("requested_at"))
+            if ts is not None:
+                oldest_queued_entry = entry
+                oldest_queued_at = ts
+                break
 
     return {
         "total_entries": total,
         "active_entries": queued + running,
         "queued_entries": queued,
         "running_entries": running,
-    "completed_entries": completed,
+        "completed_entries": completed,
         "failed_entries": failed,
         "last_completed_entry_id": (latest_completed_entry or {}).get("id"),
         "last_completed_persona_id": (latest_completed_entry or {}).get("persona_id"),
@@ -208,8 +292,10 @@ def summarize_queue(entries: Optional[List[Dict[str, Any]]] = None) -> Dict[str,
     }
 
 __all__ = [
+    "enqueue_and_finalize",
     "enqueue_evaluation",
     "get_queue_entry",
+    "get_queue_entry_with_etag",
     "list_queue_entries",
     "summarize_queue",
     "update_queue_entry",
@@ -1,62 +1,607 @@
-"""JSON-backed persistence utilities for orchestration state."""
+"""JSON-backed persistence utilities for orchestration state.
+
+State is partitioned per collection (``queue``, ``responses``, ``pairs``,
+``votes``). Each partition owns a JSON snapshot (``<name>.json``), an
+append-only write-ahead log (``<name>.log``) and its own lock, so a mutation
+only ever touches the files and lock of the collection it changes. A partition
+is parsed on first access and kept in memory; mutators apply their change to
+the cached entries and append one canonical JSON line describing it. A
+background thread periodically folds each dirty log into a fresh snapshot so
+replay stays short. Audit events live in their own append-only JSONL file
+(``audit.jsonl``) managed by :mod:`.audit`.
+
+Log writes are flat-combined per partition: mutators queue their record while
+holding the collection lock and then call :func:`sync_records` after releasing
+it. Whichever caller wins the partition's writer lock writes every queued record
+with a single ``write()`` + ``fdatasync()`` and wakes the rest.
+"""
 
 from __future__ import annotations
 
+import atexit
 import json
+import mmap
+import os
+import threading
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, MutableMapping
+from types import MappingProxyType
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+try:  # Optional speedup; the stdlib json module is the fallback.
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - exercised when the extra is absent
+    orjson = None  # type: ignore[assignment]
 
 STATE_DIR = Path(__file__).resolve().parent / "data"
-STATE_PATH = STATE_DIR / "admin_state.json"
-STATE_LOCK = Lock()
+AUDIT_PATH = STATE_DIR / "audit.jsonl"
+# Single-file snapshot written before state was partitioned; read for migration.
+LEGACY_STATE_PATH = STATE_DIR / "admin_state.json"
+
+# Partition names, in the order their locks must be acquired.
+COLLECTIONS = ("queue", "responses", "pairs", "votes")
+
+COLLECTION_LIMITS: Dict[str, int] = {
+    "queue": 500,
+    "audit": 1000,
+    "responses": 1000,
+    "pairs": 500,
+    "votes": 5000,
+}
+
+# Collections held as ``deque(maxlen=...)`` so appends evict in O(1).
+_BOUNDED_KEYS = ("queue", "responses", "pairs", "votes")
+# Collections with an ``id -> entry`` map for O(1) lookups and updates.
+_INDEXED_KEYS = ("queue", "responses", "pairs")
+# Collections additionally bucketed by these fields (oldest→newest per bucket).
+_GROUPED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "responses": ("target_id", "target_kind", "status"),
+}
+
+_SEQUENCE_KEY = "log_sequence"
+_ENTRIES_KEY = "entries"
+_SNAPSHOT_RECORD_THRESHOLD = 256
+_SNAPSHOT_INTERVAL_SECONDS = 30.0
+
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+@dataclass(slots=True)
+class _Partition:
+    """Cached entries, log handle and locks for one state collection."""
+
+    name: str
+    lock: Lock = field(default_factory=Lock)
+    writer_lock: Lock = field(default_factory=Lock)
+    entries: Optional[Any] = None
+    index: Optional[Dict[str, Dict[str, Any]]] = None
+    groups: Optional[Dict[Tuple[Any, ...], Deque[Dict[str, Any]]]] = None
+    log_fd: Optional[int] = None
+    sequence: int = 0
+    records_since_snapshot: int = 0
+    pending: Deque[Tuple[bytes, threading.Event]] = field(default_factory=deque)
+
+    @property
+    def snapshot_path(self) -> Path:
+        return STATE_DIR / f"{self.name}.json"
+
+    @property
+    def log_path(self) -> Path:
+        return STATE_DIR / f"{self.name}.log"
+
 
-_STATE_KEYS = ("queue", "audit", "responses", "pairs", "votes")
+_PARTITIONS: Dict[str, _Partition] = {name: _Partition(name) for name in COLLECTIONS}
+_SNAPSHOT_REQUESTED = threading.Event()
+_SNAPSHOT_THREAD: Optional[threading.Thread] = None
+
+
+def _dumps(payload: Any, *, indent: bool = False) -> bytes:
+    """Encode ``payload`` as UTF-8 JSON with sorted keys."""
+
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option)
+    if indent:
+        text = json.dumps(payload, indent=2, ensure_ascii=False, sort_keys=True)
+    else:
+        text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    return text.encode("utf-8")
+
+
+def _loads(data: bytes | memoryview) -> Any:
+    """Decode JSON bytes; raises ``json.JSONDecodeError`` on malformed input."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def _load_mapped(path: Path) -> Any:
+    """Decode a JSON file through a read-only memory map (no ``read()`` copy)."""
+
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return _loads(view)
 
 
 def _ensure_state_dir() -> None:
     STATE_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_state() -> Dict[str, Any]:
-    """Load the persisted admin state (ensuring expected collections)."""
+def _read_json(path: Path) -> Optional[MutableMapping[str, Any]]:
+    if not path.exists():
+        return None
+    try:
+        data = _load_mapped(path)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, MutableMapping) else None
+
+
+def _coerce_entries(name: str, entries: Any) -> Any:
+    if not isinstance(entries, (list, deque)):
+        entries = []
+    if name in _BOUNDED_KEYS:
+        return deque(entries, maxlen=COLLECTION_LIMITS[name])
+    return list(entries)
+
+
+def _read_snapshot(partition: _Partition) -> Tuple[Any, int]:
+    data = _read_json(partition.snapshot_path)
+    if data is not None:
+        sequence = int(data.get(_SEQUENCE_KEY, 0) or 0)
+        return _coerce_entries(partition.name, data.get(_ENTRIES_KEY)), sequence
+
+    legacy = _read_json(LEGACY_STATE_PATH)
+    if legacy is not None:
+        # Seed the partition from the old single-file snapshot until it writes its own.
+        return _coerce_entries(partition.name, legacy.get(partition.name)), 0
+    return _coerce_entries(partition.name, None), 0
 
-    if STATE_PATH.exists():
+
+def _read_log(partition: _Partition) -> List[Dict[str, Any]]:
+    if not partition.log_path.exists():
+        return []
+
+    records: List[Dict[str, Any]] = []
+    with partition.log_path.open("rb") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError:
+                # A torn write from a crash; it never reached a complete line.
+                continue
+            if isinstance(record, MutableMapping):
+                records.append(record)
+    return records
+
+
+def _build_index(entries: Any) -> Dict[str, Dict[str, Any]]:
+    # Later duplicates win, matching a newest-first scan.
+    return {entry["id"]: entry for entry in entries if entry.get("id")}
+
+
+def _group_key(partition: _Partition, entry: MutableMapping[str, Any]) -> Tuple[Any, ...]:
+    return tuple(entry.get(name) for name in _GROUPED_FIELDS[partition.name])
+
+
+def _build_groups(partition: _Partition) -> Dict[Tuple[Any, ...], Deque[Dict[str, Any]]]:
+    groups: Dict[Tuple[Any, ...], Deque[Dict[str, Any]]] = {}
+    for entry in partition.entries:
+        groups.setdefault(_group_key(partition, entry), deque()).append(entry)
+    return groups
+
+
+def _ungroup(partition: _Partition, entry: Dict[str, Any], key: Tuple[Any, ...]) -> None:
+    members = partition.groups.get(key)
+    if not members:
+        return
+    if members[0] is entry:
+        # Evictions always hit the oldest entry, which leads its bucket.
+        members.popleft()
+    else:
         try:
-            with STATE_PATH.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            if isinstance(data, MutableMapping):
-                state: Dict[str, Any] = dict(data)
-                for key in _STATE_KEYS:
-                    state.setdefault(key, [])
-                return state
-        except json.JSONDecodeError:
-            pass
-    return {key: [] for key in _STATE_KEYS}
+            members.remove(entry)
+        except ValueError:
+            return
+    if not members:
+        del partition.groups[key]
+
+
+def _apply_record(partition: _Partition, record: MutableMapping[str, Any]) -> None:
+    payload = record.get("payload")
+    if not isinstance(payload, MutableMapping):
+        return
+
+    entries = partition.entries
+    index = partition.index
+    groups = partition.groups
+    entry_id = payload.get("id")
+    op = record.get("op")
+    if op == "append":
+        entry = dict(payload)
+        maxlen = getattr(entries, "maxlen", None)
+        if maxlen is not None and len(entries) == maxlen:
+            evicted = entries[0]
+            if index is not None and index.get(evicted.get("id")) is evicted:
+                del index[evicted["id"]]
+            if groups is not None:
+                _ungroup(partition, evicted, _group_key(partition, evicted))
+        entries.append(entry)
+        limit = COLLECTION_LIMITS.get(partition.name)
+        if isinstance(entries, list) and limit is not None and len(entries) > limit:
+            del entries[:-limit]
+        if index is not None and entry_id:
+            index[entry_id] = entry
+        if groups is not None:
+            groups.setdefault(_group_key(partition, entry), deque()).append(entry)
+    elif op == "update":
+        # Swap in a fresh dict instead of editing the cached one: listings hand
+        # cached entries out without copying, so a published dict never changes.
+        entry = dict(payload)
+        existing = None
+        if index is not None:
+            existing = index.get(entry_id)
+            if existing is None:
+                return
+            index[entry_id] = entry
+        # Updates target recent entries, so scan from the newest end.
+        for position in range(len(entries) - 1, -1, -1):
+            current = entries[position]
+            if current is existing or (existing is None and current.get("id") == entry_id):
+                entries[position] = entry
+                break
+        if groups is not None and existing is not None:
+            old_key = _group_key(partition, existing)
+            new_key = _group_key(partition, entry)
+            members = groups.get(old_key, ())
+            if new_key == old_key:
+                for position, member in enumerate(members):
+                    if member is existing:
+                        members[position] = entry
+                        break
+            else:
+                _ungroup(partition, existing, old_key)
+                groups.setdefault(new_key, deque()).append(entry)
+
+
+def _loaded(name: str) -> _Partition:
+    partition = _PARTITIONS[name]
+    if partition.entries is not None:
+        return partition
+
+    entries, sequence = _read_snapshot(partition)
+    partition.entries = entries
+    partition.index = _build_index(entries) if name in _INDEXED_KEYS else None
+    partition.groups = _build_groups(partition) if name in _GROUPED_FIELDS else None
+    for record in _read_log(partition):
+        record_sequence = int(record.get("seq", 0) or 0)
+        if record_sequence <= sequence:
+            # Already folded into the snapshot (crash between snapshot and truncate).
+            continue
+        _apply_record(partition, record)
+        sequence = record_sequence
+    partition.sequence = sequence
+    return partition
+
+
+@contextmanager
+def state_lock(*collections: str) -> Iterator[None]:
+    """Hold the locks of ``collections``, acquired in the canonical order."""
+
+    with ExitStack() as stack:
+        for name in COLLECTIONS:
+            if name in collections:
+                stack.enter_context(_PARTITIONS[name].lock)
+        yield
+
+
+def load_collection(name: str) -> Any:
+    """Return the live cached entries of one collection.
+
+    Callers must hold ``state_lock(name)`` and change the entries only through
+    :func:`append_record` or :func:`persist_collection`.
+    """
+
+    return _loaded(name).entries
+
+
+def load_state() -> Mapping[str, Any]:
+    """Return a read-only view of every collection keyed by name.
+
+    The view shares the live cached entries rather than cloning them, so
+    callers must hold all locks and change entries only through
+    :func:`append_record`.
+    """
+
+    return MappingProxyType({name: load_collection(name) for name in COLLECTIONS})
 
 
-def persist_state(state: Dict[str, Any]) -> None:
-    """Persist the provided state dictionary atomically."""
+def lookup_entry(collection: str, entry_id: str) -> Optional[Dict[str, Any]]:
+    """Return the cached entry for ``entry_id`` (callers must hold its lock).
 
+    The result is the live cached record; copy it before handing it out.
+    """
+
+    return collection_index(collection).get(entry_id)
+
+
+def collection_index(collection: str) -> Dict[str, Dict[str, Any]]:
+    """Return the live ``id -> entry`` map for an indexed collection."""
+
+    index = _loaded(collection).index
+    if index is None:
+        raise KeyError(f"Collection '{collection}' is not indexed")
+    return index
+
+
+def grouped_entries(collection: str, *values: Optional[Any]) -> List[Dict[str, Any]]:
+    """Return live entries whose grouping fields equal ``values``.
+
+    ``values`` follow the collection's grouping fields; ``None`` matches any
+    value. Entries come back oldest→newest within each bucket. Callers must
+    hold ``state_lock(collection)``.
+    """
+
+    groups = _loaded(collection).groups
+    if groups is None:
+        raise KeyError(f"Collection '{collection}' is not grouped")
+    if None not in values:
+        return list(groups.get(tuple(values), ()))
+
+    matched: List[Dict[str, Any]] = []
+    for key, members in groups.items():
+        if all(value is None or value == part for value, part in zip(values, key)):
+            matched.extend(members)
+    return matched
+
+
+def _log_fd(partition: _Partition) -> int:
+    if partition.log_fd is None:
+        _ensure_state_dir()
+        flags = os.O_RDWR | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC
+        fd = os.open(partition.log_path, flags, 0o644)
+        size = os.fstat(fd).st_size
+        if size and os.pread(fd, 1, size - 1) != b"\n":
+            # Terminate a torn record so the next append starts on a fresh line.
+            os.write(fd, b"\n")
+        partition.log_fd = fd
+    return partition.log_fd
+
+
+def _close_log(partition: _Partition) -> None:
+    if partition.log_fd is not None:
+        os.close(partition.log_fd)
+        partition.log_fd = None
+
+
+def append_record(collection: str, op: str, payload: Dict[str, Any]) -> threading.Event:
+    """Apply a mutation to the cached collection and queue it for its log.
+
+    ``op`` is ``"append"`` (new entry, subject to the collection cap) or
+    ``"update"`` (replace the entry sharing ``payload["id"]``). Callers must
+    hold ``state_lock(collection)`` and pass the returned marker to
+    :func:`sync_records` once the lock is released.
+    """
+
+    partition = _loaded(collection)
+    partition.sequence += 1
+
+    record = {"collection": collection, "op": op, "payload": payload, "seq": partition.sequence}
+    encoded = _dumps(record)
+    # Cache the decoded record rather than ``payload``: the cache then shares no
+    # nested objects with the caller and holds exactly what a log replay yields.
+    _apply_record(partition, _loads(encoded))
+    marker = threading.Event()
+    partition.pending.append((encoded + b"\n", marker))
+
+    partition.records_since_snapshot += 1
+    _ensure_snapshot_thread()
+    if partition.records_since_snapshot >= _SNAPSHOT_RECORD_THRESHOLD:
+        _SNAPSHOT_REQUESTED.set()
+    return marker
+
+
+def sync_records(
+    collection: Optional[str] = None,
+    marker: Optional[threading.Event] = None,
+) -> None:
+    """Durably write queued log records, batching concurrent callers.
+
+    Returns once ``marker``'s record (or, without a marker, every queued
+    record of ``collection``, or of every collection when omitted) has reached
+    disk.
+    """
+
+    if marker is not None and marker.is_set():
+        return
+    if collection is None:
+        for name in COLLECTIONS:
+            _flush(_PARTITIONS[name], None)
+        return
+    _flush(_PARTITIONS[collection], marker)
+
+
+def _flush(partition: _Partition, marker: Optional[threading.Event]) -> None:
+    with partition.writer_lock:
+        if marker is not None and marker.is_set():
+            # Another writer flushed our record while we waited for the lock.
+            return
+        batch: List[Tuple[bytes, threading.Event]] = []
+        while partition.pending:
+            batch.append(partition.pending.popleft())
+        if not batch:
+            return
+
+        try:
+            fd = _log_fd(partition)
+            os.write(fd, b"".join(line for line, _ in batch))
+            _fdatasync(fd)
+        except OSError:
+            partition.pending.extendleft(reversed(batch))
+            raise
+
+        for _, waiter in batch:
+            waiter.set()
+
+
+def persist_collection(name: str) -> None:
+    """Write a snapshot of one collection atomically and truncate its log.
+
+    Callers must hold ``state_lock(name)``; entries changed in place on the
+    list returned by :func:`load_collection` are captured by the snapshot.
+    """
+
+    partition = _loaded(name)
+    with partition.writer_lock:
+        _write_snapshot(partition)
+        while partition.pending:
+            partition.pending.popleft()[1].set()
+    partition.records_since_snapshot = 0
+
+
+def flush_state() -> None:
+    """Durably write queued log records, then snapshot every dirty collection."""
+
+    sync_records()
+    snapshot_state()
+
+
+def _write_snapshot(partition: _Partition) -> None:
     _ensure_state_dir()
-    tmp_path = STATE_PATH.with_suffix(".tmp")
-    with tmp_path.open("w", encoding="utf-8") as handle:
-        json.dump(state, handle, indent=2, ensure_ascii=False)
-    tmp_path.replace(STATE_PATH)
+    payload = {_ENTRIES_KEY: list(partition.entries), _SEQUENCE_KEY: partition.sequence}
+    snapshot_path = partition.snapshot_path
+    tmp_path = snapshot_path.with_suffix(".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        data = memoryview(_dumps(payload, indent=True))
+        while data:
+            data = data[os.write(fd, data):]
+        _fdatasync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, snapshot_path)
+    _fsync_directory(STATE_DIR)
+
+    if partition.log_fd is not None:
+        os.ftruncate(partition.log_fd, 0)
+    elif partition.log_path.exists():
+        partition.log_path.unlink()
+
+
+def _fsync_directory(path: Path) -> None:
+    """Flush a directory entry so a preceding rename survives a crash."""
+
+    if not hasattr(os, "O_DIRECTORY"):  # pragma: no cover - Windows has no directory fds
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def snapshot_state() -> None:
+    """Fold pending log records of every dirty collection into fresh snapshots."""
+
+    for name in COLLECTIONS:
+        partition = _PARTITIONS[name]
+        with partition.lock:
+            if partition.records_since_snapshot == 0:
+                continue
+            persist_collection(name)
+
+
+def _snapshot_loop() -> None:
+    while True:
+        _SNAPSHOT_REQUESTED.wait(_SNAPSHOT_INTERVAL_SECONDS)
+        _SNAPSHOT_REQUESTED.clear()
+        snapshot_state()
+
+
+def _ensure_snapshot_thread() -> None:
+    global _SNAPSHOT_THREAD
+    if _SNAPSHOT_THREAD is None or not _SNAPSHOT_THREAD.is_alive():
+        _SNAPSHOT_THREAD = threading.Thread(
+            target=_snapshot_loop,
+            name="state-snapshot",
+            daemon=True,
+        )
+        _SNAPSHOT_THREAD.start()
+
+
+atexit.register(flush_state)
+
+
+def _drop_cache() -> None:
+    """Close logs and forget cached entries (callers must hold every lock)."""
+
+    for partition in _PARTITIONS.values():
+        with partition.writer_lock:
+            _close_log(partition)
+        partition.entries = None
+        partition.index = None
+        partition.groups = None
 
 
 def clear_state() -> None:
-    """Remove the persisted state file (used in tests)."""
+    """Remove the persisted snapshots, logs, and cached state (used in tests)."""
+
+    # Imported lazily: the audit module depends on this one.
+    from .audit import _discard_pending
 
-    with STATE_LOCK:
-        if STATE_PATH.exists():
-            STATE_PATH.unlink()
+    _discard_pending()
+    with state_lock(*COLLECTIONS):
+        for partition in _PARTITIONS.values():
+            with partition.writer_lock:
+                while partition.pending:
+                    partition.pending.popleft()[1].set()
+            partition.sequence = 0
+            partition.records_since_snapshot = 0
+        _drop_cache()
+        paths = [AUDIT_PATH, LEGACY_STATE_PATH]
+        for partition in _PARTITIONS.values():
+            paths.extend((partition.snapshot_path, partition.log_path))
+        for path in paths:
+            if path.exists():
+                path.unlink()
 
 __all__ = [
+    "AUDIT_PATH",
+    "COLLECTIONS",
+    "COLLECTION_LIMITS",
+    "LEGACY_STATE_PATH",
     "STATE_DIR",
-    "STATE_PATH",
-    "STATE_LOCK",
+    "append_record",
     "clear_state",
+    "collection_index",
+    "flush_state",
+    "grouped_entries",
+    "load_collection",
     "load_state",
-    "persist_state",
+    "lookup_entry",
+    "persist_collection",
+    "snapshot_state",
+    "state_lock",
+    "sync_records",
 ]
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import copy
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Dict, Iterable, List, Optional
-from uuid import uuid4
 
-from .repository import STATE_LOCK, load_state, persist_state
-from .utils import normalize_for_storage, normalize_metadata
-
-_MAX_RESPONSE_ENTRIES = 1000
+from .repository import (
+    append_record,
+    grouped_entries,
+    load_collection,
+    lookup_entry,
+    state_lock,
+    sync_records,
+)
+from .utils import new_id, normalize_for_storage, normalize_metadata
 
 
 @dataclass(slots=True)
@@ -31,6 +36,23 @@ class EvaluationResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def _serialize_response(entry: EvaluationResponse) -> Dict[str, Any]:
+    return {
+        "id": entry.id,
+        "run_id": entry.run_id,
+        "persona_id": entry.persona_id,
+        "target_id": entry.target_id,
+        "target_kind": entry.target_kind,
+        "adapter": entry.adapter,
+        "status": entry.status,
+        "created_at": entry.created_at,
+        "summary": entry.summary,
+        "steps": entry.steps,
+        "trace": entry.trace,
+        "metadata": entry.metadata,
+    }
+
+
 def list_evaluation_responses(
     *,
     persona_id: Optional[str] = None,
@@ -39,11 +61,18 @@ def list_evaluation_responses(
     status: Optional[str] = None,
     limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    """Return persisted evaluation responses filtered for review."""
+    """Return persisted evaluation responses filtered for review.
+
+    Entries are shared with the in-memory cache and must be treated as
+    read-only.
+    """
 
-    with STATE_LOCK:
-        state = load_state()
-        entries: List[Dict[str, Any]] = list(state.get("responses", []))
+    with state_lock("responses"):
+        if target_id and target_kind and status:
+            # A fully specified key is a single bucket of the grouped index.
+            entries = grouped_entries("responses", target_id, target_kind, status)
+        else:
+            entries = list(load_collection("responses"))
 
     filtered: List[Dict[str, Any]] = []
     for payload in entries:
@@ -55,7 +84,7 @@ def list_evaluation_responses(
             continue
         if status and payload.get("status") != status:
             continue
-        filtered.append(dict(payload))
+        filtered.append(payload)
 
     if limit is not None:
         filtered = filtered[-limit:]
@@ -67,13 +96,9 @@ def list_evaluation_responses(
 def get_evaluation_response(response_id: str) -> Optional[Dict[str, Any]]:
     """Return a single evaluation response by identifier."""
 
-    with STATE_LOCK:
-        state = load_state()
-        entries: List[Dict[str, Any]] = list(state.get("responses", []))
-    for payload in reversed(entries):
-        if payload.get("id") == response_id:
-            return dict(payload)
-    return None
+    with state_lock("responses"):
+        payload = lookup_entry("responses", response_id)
+        return copy.deepcopy(payload) if payload is not None else None
 
 
 def record_evaluation_response(
@@ -93,7 +118,7 @@ def record_evaluation_response(
     """Persist an evaluation response for downstream feedback workflows."""
 
     entry = EvaluationResponse(
-        id=response_id or str(uuid4()),
+        id=response_id or new_id(),
         run_id=run_id,
         persona_id=persona_id,
         target_id=target_id,
@@ -102,21 +127,16 @@ def record_evaluation_response(
         status=status,
         created_at=datetime.now(UTC).isoformat(),
         summary=normalize_for_storage(dict(summary)),
-        steps=[normalize_for_storage(step) for step in (steps or [])],
-        trace=[normalize_for_storage(event) for event in (trace or [])],
+        steps=normalize_for_storage(list(steps or [])),
+        trace=normalize_for_storage(list(trace or [])),
         metadata=normalize_metadata(metadata),
     )
 
-    with STATE_LOCK:
-        state = load_state()
-        entries: List[Dict[str, Any]] = list(state.get("responses", []))
-        entries.append(asdict(entry))
-        if len(entries) > _MAX_RESPONSE_ENTRIES:
-            entries = entries[-_MAX_RESPONSE_ENTRIES:]
-        state["responses"] = entries
-        persist_state(state)
+    with state_lock("responses"):
+        marker = append_record("responses", "append", _serialize_response(entry))
+    sync_records("responses", marker)
 
-    return asdict(entry)
+    return _serialize_response(entry)
 
 __all__ = [
     "get_evaluation_response",
@@ -2,42 +2,152 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime
-from typing import Any, Dict, Iterable, MutableMapping, Optional
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple
+from uuid import UUID
+
+_UUID_BATCH = 1024
+_UUID_LOCK = Lock()
+_uuid_buffer = b""
+_uuid_offset = 0
+
+
+def new_id() -> str:
+    """Return a random UUID4 string, drawing entropy in 16 KiB batches.
+
+    Equivalent to ``str(uuid4())`` but amortises the ``getrandom`` syscall
+    over ``_UUID_BATCH`` identifiers.
+    """
+
+    global _uuid_buffer, _uuid_offset
+
+    with _UUID_LOCK:
+        if _uuid_offset >= len(_uuid_buffer):
+            _uuid_buffer = os.urandom(16 * _UUID_BATCH)
+            _uuid_offset = 0
+        chunk = _uuid_buffer[_uuid_offset : _uuid_offset + 16]
+        _uuid_offset += 16
+    return str(UUID(bytes=chunk, version=4))
+
+
+def _reset_uuid_pool() -> None:
+    global _uuid_buffer, _uuid_offset
+    # A forked child must not hand out the identifiers its parent still holds.
+    _uuid_buffer = b""
+    _uuid_offset = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
 
 
 def normalize_metadata(payload: Any) -> Dict[str, Any]:
     """Return a shallow copy of metadata dictionaries."""
 
+    if not payload:
+        return {}
     if isinstance(payload, MutableMapping):
         return dict(payload)
     return {}
 
 
+_PERSONA_PREFIX_INITIALS = frozenset("pP")
+
+
 def sanitize_metadata(payload: Any) -> Dict[str, Any]:
     """Remove sensitive persona-prefixed keys from metadata payloads."""
 
-    if not isinstance(payload, MutableMapping):
+    if not payload or not isinstance(payload, MutableMapping):
         return {}
 
-    sanitized: Dict[str, Any] = {}
-    for key, value in payload.items():
-        if key.lower().startswith("persona_"):
-            continue
-        sanitized[key] = value
-    return sanitized
+    # Check the first character before lowercasing so most keys skip the copy,
+    # and lowercase only the prefix for those that might match.
+    return {
+        key: value
+        for key, value in payload.items()
+        if not (key[:1] in _PERSONA_PREFIX_INITIALS and key[:8].lower() == "persona_")
+    }
 
 
-def normalize_for_storage(value: Any) -> Any:
-    """Recursively convert complex values into JSON-serialisable types."""
+# A pending container: (converted container, source iterator, is_mapping).
+_Frame = Tuple[Any, Iterator[Any], bool]
+
 
+def _leaf(value: Any) -> Tuple[Any, Optional[_Frame]]:
+    return value, None
+
+
+def _timestamp(value: datetime) -> Tuple[Any, Optional[_Frame]]:
+    return value.isoformat(), None
+
+
+def _mapping(value: Any) -> Tuple[Any, Optional[_Frame]]:
+    converted: Dict[Any, Any] = {}
+    return converted, (converted, iter(value.items()), True)
+
+
+def _sequence(value: Any) -> Tuple[Any, Optional[_Frame]]:
+    converted: List[Any] = []
+    return converted, (converted, iter(value), False)
+
+
+# Exact-type dispatch for the common cases; subclasses and anything else fall
+# back to the isinstance chain in ``_classify``.
+_DISPATCH: Dict[type, Callable[[Any], Tuple[Any, Optional[_Frame]]]] = {
+    str: _leaf,
+    int: _leaf,
+    float: _leaf,
+    bool: _leaf,
+    type(None): _leaf,
+    bytes: _leaf,
+    datetime: _timestamp,
+    dict: _mapping,
+    list: _sequence,
+    tuple: _sequence,
+}
+
+
+def _classify(value: Any) -> Tuple[Any, Optional[_Frame]]:
     if isinstance(value, datetime):
-        return value.isoformat()
+        return _timestamp(value)
     if isinstance(value, MutableMapping):
-        return {key: normalize_for_storage(item) for key, item in value.items()}
+        return _mapping(value)
     if isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
-        return [normalize_for_storage(item) for item in value]
-    return value
+        return _sequence(value)
+    return _leaf(value)
+
+
+def normalize_for_storage(value: Any) -> Any:
+    """Recursively convert complex values into JSON-serialisable types.
+
+    Datetimes become ISO strings, mappings become dicts and other iterables
+    become lists; any other leaf is kept as-is.
+    """
+
+    # Iterative walk: containers are created up front and filled from a stack,
+    # so deep payloads cost no Python frames and never hit the recursion limit.
+    handler = _DISPATCH.get(type(value), _classify)
+    result, frame = handler(value)
+    stack: List[_Frame] = [frame] if frame is not None else []
+    while stack:
+        container, items, is_mapping = stack[-1]
+        for item in items:
+            if is_mapping:
+                key, item = item
+            converted, frame = _DISPATCH.get(type(item), _classify)(item)
+            if is_mapping:
+                container[key] = converted
+            else:
+                container.append(converted)
+            if frame is not None:
+                stack.append(frame)
+                break
+        else:
+            stack.pop()
+    return result
 
 
 def parse_timestamp(value: Any) -> Optional[datetime]:
@@ -46,11 +156,25 @@ def parse_timestamp(value: Any) -> Optional[datetime]:
     if isinstance(value, datetime):
         return value
     if isinstance(value, str) and value:
-        try:
-            normalized = value.replace("Z", "+00:00")
-            return datetime.fromisoformat(normalized)
-        except ValueError:
-            return None
+        return _parse_iso_string(value)
     return None
 
-__all__ = ["normalize_for_storage", "normalize_metadata", "parse_timestamp", "sanitize_metadata"]
+
+@lru_cache(maxsize=4096)
+def _parse_iso_string(value: str) -> Optional[datetime]:
+    # Stored timestamps are immutable strings re-read on every queue summary.
+    if value.endswith("Z"):
+        # Only the UTC designator needs rewriting; offset forms parse as-is.
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+__all__ = [
+    "new_id",
+    "normalize_for_storage",
+    "normalize_metadata",
+    "parse_timestamp",
+    "sanitize_metadata",
+]
@@ -2,16 +2,47 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import asdict, dataclass, field
+from collections import Counter, deque
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Tuple
-from uuid import uuid4
-
-from .repository import STATE_LOCK, load_state, persist_state
-from .utils import normalize_metadata, sanitize_metadata
-
-_MAX_VOTE_ENTRIES = 5000
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+try:  # Optional speedup; the pure-Python iteration below is the fallback.
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - exercised when the extra is absent
+    np = None  # type: ignore[assignment]
+
+from .repository import (
+    append_record,
+    load_collection,
+    lookup_entry,
+    state_lock,
+    sync_records,
+)
+from .utils import new_id, normalize_metadata, sanitize_metadata
+
+_VALID_SLOTS: frozenset[str] = frozenset(("A", "B"))
+_SLOT_OPPOSITE = {"A": "B", "B": "A"}
+
+# Secondary ``field value -> votes (oldest→newest)`` indexes over the cached
+# votes; rebuilt whenever the repository hands out a different container.
+_VOTE_INDEX_FIELDS = ("pair_id", "target_id", "adapter")
+_VoteIndexes = Dict[str, Dict[Any, Deque[Dict[str, Any]]]]
+_VOTE_INDEXES: _VoteIndexes = {}
+_INDEXED_VOTES: Optional[Any] = None
 
 
 @dataclass(slots=True)
@@ -35,19 +66,58 @@ class ComparisonVote:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+_PUBLIC_VOTE_FIELDS = (
+    "id",
+    "pair_id",
+    "winner_slot",
+    "winning_response_id",
+    "losing_response_id",
+    "recorded_at",
+    "reviewer",
+    "rationale",
+    "confidence",
+)
+_public_vote_fields = itemgetter(*_PUBLIC_VOTE_FIELDS)
+
+
 def _public_vote_payload(vote_record: Dict[str, Any]) -> Dict[str, Any]:
-    return {
-        "id": vote_record.get("id"),
-        "pair_id": vote_record.get("pair_id"),
-        "winner_slot": vote_record.get("winner_slot"),
-        "winning_response_id": vote_record.get("winning_response_id"),
-        "losing_response_id": vote_record.get("losing_response_id"),
-        "recorded_at": vote_record.get("recorded_at"),
-        "reviewer": vote_record.get("reviewer"),
-        "rationale": vote_record.get("rationale"),
-        "confidence": vote_record.get("confidence"),
-        "metadata": sanitize_metadata(vote_record.get("metadata")),
-    }
+    try:
+        payload = dict(zip(_PUBLIC_VOTE_FIELDS, _public_vote_fields(vote_record)))
+    except KeyError:
+        # Records written before every field was serialised may lack some keys.
+        payload = {name: vote_record.get(name) for name in _PUBLIC_VOTE_FIELDS}
+    payload["metadata"] = sanitize_metadata(vote_record.get("metadata"))
+    return payload
+
+
+def _vote_indexes(votes: Any) -> _VoteIndexes:
+    """Return indexes for ``votes`` (callers must hold the votes lock)."""
+
+    global _INDEXED_VOTES, _VOTE_INDEXES
+
+    if _INDEXED_VOTES is not votes:
+        indexes: _VoteIndexes = {name: {} for name in _VOTE_INDEX_FIELDS}
+        for entry in votes:
+            _index_vote(indexes, entry)
+        _VOTE_INDEXES = indexes
+        _INDEXED_VOTES = votes
+    return _VOTE_INDEXES
+
+
+def _index_vote(indexes: _VoteIndexes, entry: Dict[str, Any]) -> None:
+    for name in _VOTE_INDEX_FIELDS:
+        indexes[name].setdefault(entry.get(name), deque()).append(entry)
+
+
+def _unindex_vote(indexes: _VoteIndexes, entry: Dict[str, Any]) -> None:
+    for name in _VOTE_INDEX_FIELDS:
+        key = entry.get(name)
+        bucket = indexes[name].get(key)
+        # Evictions remove the oldest vote, which always leads its bucket.
+        if bucket and bucket[0] is entry:
+            bucket.popleft()
+            if not bucket:
+                del indexes[name][key]
 
 
 def list_comparison_votes(
@@ -55,25 +125,39 @@ def list_comparison_votes(
 ) -> List[Dict[str, Any]]:
     """Return recorded comparison votes ordered newest first."""
 
-    with STATE_LOCK:
-        state = load_state()
-        votes_raw: List[Dict[str, Any]] = [dict(entry) for entry in state.get("votes", [])]
-
-    filtered: List[Dict[str, Any]] = []
-    for payload in votes_raw:
-        if pair_id and payload.get("pair_id") != pair_id:
-            continue
-        filtered.append(payload)
-
-    if limit is not None:
-        filtered = filtered[-limit:]
-
-    filtered.reverse()
-    return [_public_vote_payload(entry) for entry in filtered]
+    results: List[Dict[str, Any]] = []
+    with state_lock("votes"):
+        # Walk newest→oldest and stop at ``limit``; the public payload already
+        # extracts fields, so the stored votes are never copied wholesale.
+        votes = load_collection("votes")
+        candidates = _vote_indexes(votes)["pair_id"].get(pair_id, ()) if pair_id else votes
+        for payload in reversed(candidates):
+            if pair_id and payload.get("pair_id") != pair_id:
+                continue
+            results.append(_public_vote_payload(payload))
+            if limit and len(results) >= limit:
+                break
+    return results
 
 
 def _serialize_vote(vote: ComparisonVote) -> Dict[str, Any]:
-    return asdict(vote)
+    return {
+        "id": vote.id,
+        "pair_id": vote.pair_id,
+        "target_id": vote.target_id,
+        "target_kind": vote.target_kind,
+        "adapter": vote.adapter,
+        "winner_slot": vote.winner_slot,
+        "winning_response_id": vote.winning_response_id,
+        "losing_response_id": vote.losing_response_id,
+        "winning_persona_id": vote.winning_persona_id,
+        "losing_persona_id": vote.losing_persona_id,
+        "recorded_at": vote.recorded_at,
+        "reviewer": vote.reviewer,
+        "rationale": vote.rationale,
+        "confidence": vote.confidence,
+        "metadata": vote.metadata,
+    }
 
 
 def record_comparison_vote(
@@ -89,29 +173,21 @@ def record_comparison_vote(
     """Persist a reviewer vote for an existing comparison pair."""
 
     normalized_slot = winner_slot.strip().upper()
-    if normalized_slot not in {"A", "B"}:
+    if normalized_slot not in _VALID_SLOTS:
         raise ValueError("winner_slot must be either 'A' or 'B'")
 
-    with STATE_LOCK:
-        state = load_state()
-        pairs: List[Dict[str, Any]] = [dict(entry) for entry in state.get("pairs", [])]
-        pair_record: Optional[Dict[str, Any]] = None
-        for entry in pairs:
-            if entry.get("id") == pair_id:
-                pair_record = dict(entry)
-                break
-
+    with state_lock("pairs", "votes"):
+        # The live cached record is only read here; the update below copies it.
+        pair_record = lookup_entry("pairs", pair_id)
         if pair_record is None:
             raise KeyError(f"Comparison pair '{pair_id}' not found")
 
-        assignments = pair_record.get("responses", [])
-        slot_index = {
-            assignment.get("slot"): assignment
-            for assignment in assignments
-            if isinstance(assignment, MutableMapping)
-            and assignment.get("slot") in {"A", "B"}
-            and assignment.get("response_id")
-        }
+        # Assignments are the plain dicts written by ``_serialize_pair``.
+        slot_index: Dict[str, Dict[str, Any]] = {}
+        for assignment in pair_record.get("responses", ()):
+            slot = assignment.get("slot")
+            if slot in _VALID_SLOTS and assignment.get("response_id"):
+                slot_index[slot] = assignment
 
         winning_assignment = slot_index.get(normalized_slot)
         if winning_assignment is None:
@@ -119,15 +195,14 @@ def record_comparison_vote(
                 f"Comparison pair '{pair_id}' does not include slot '{normalized_slot}'"
             )
 
-        losing_slot = "B" if normalized_slot == "A" else "A"
-        losing_assignment = slot_index.get(losing_slot)
+        losing_assignment = slot_index.get(_SLOT_OPPOSITE[normalized_slot])
         if losing_assignment is None:
             raise ValueError(
                 "Comparison pair must contain two distinct responses before recording votes"
             )
 
         vote = ComparisonVote(
-            id=vote_id or str(uuid4()),
+            id=vote_id or new_id(),
             pair_id=pair_id,
             target_id=str(pair_record.get("target_id", "")),
             target_kind=str(pair_record.get("target_kind", "scenario")),
@@ -144,38 +219,61 @@ def record_comparison_vote(
             metadata=normalize_metadata(metadata),
         )
 
-        votes: List[Dict[str, Any]] = list(state.get("votes", []))
-        votes.append(_serialize_vote(vote))
-        if len(votes) > _MAX_VOTE_ENTRIES:
-            votes = votes[-_MAX_VOTE_ENTRIES:]
+        votes: Deque[Dict[str, Any]] = load_collection("votes")
+        indexes = _vote_indexes(votes)
+        if len(votes) == votes.maxlen:
+            # The bounded deque drops its oldest vote on append.
+            _unindex_vote(indexes, votes[0])
+        vote_marker = append_record("votes", "append", _serialize_vote(vote))
+        # The repository stores its own copy of the payload; index that one.
+        _index_vote(indexes, votes[-1])
+
+        vote_count = len(indexes["pair_id"].get(pair_id, ()))
+
+        updated = dict(pair_record)
+        updated["status"] = "completed"
+        existing_metadata = updated.get("metadata")
+        if isinstance(existing_metadata, MutableMapping):
+            metadata_payload = dict(existing_metadata)
+        else:
+            metadata_payload = {}
+        metadata_payload["last_vote_recorded_at"] = vote.recorded_at
+        metadata_payload["vote_count"] = vote_count
+        updated["metadata"] = metadata_payload
+        pair_marker = append_record("pairs", "update", updated)
 
-        vote_count = sum(1 for entry in votes if entry.get("pair_id") == pair_id)
+        _aggregate_votes.cache_clear()
 
-        for index, entry in enumerate(pairs):
-            if entry.get("id") != pair_id:
-                continue
-            updated = dict(entry)
-            updated["status"] = "completed"
-            existing_metadata = updated.get("metadata")
-            if isinstance(existing_metadata, MutableMapping):
-                metadata_payload = dict(existing_metadata)
-            else:
-                metadata_payload = {}
-            metadata_payload["last_vote_recorded_at"] = vote.recorded_at
-            metadata_payload["vote_count"] = vote_count
-            updated["metadata"] = metadata_payload
-            pairs[index] = updated
-            break
-
-        state["pairs"] = pairs
-        state["votes"] = votes
-        persist_state(state)
+    sync_records("pairs", pair_marker)
+    sync_records("votes", vote_marker)
 
     return _public_vote_payload(_serialize_vote(vote))
 
 
+def _matchups(
+    win_counts: Mapping[Tuple[str, str], int], personas_list: List[str]
+) -> Tuple[Dict[str, float], List[Tuple[str, str, int]]]:
+    """Return per-persona win totals and the ``(a, b, games)`` pairs that met.
+
+    Only observed matchups are listed, so the MM updates below cost
+    O(edges) per iteration instead of visiting every persona pair.
+    """
+
+    wins = dict.fromkeys(personas_list, 1e-6)
+    games: Dict[Tuple[str, str], int] = {}
+    for (winner, loser), count in win_counts.items():
+        if winner not in wins:
+            continue
+        wins[winner] += count
+        if loser == winner or loser not in wins or not count:
+            continue
+        key = (winner, loser) if winner < loser else (loser, winner)
+        games[key] = games.get(key, 0) + count
+    return wins, [(first, second, total) for (first, second), total in games.items()]
+
+
 def _compute_bradley_terry_scores(
-    win_counts: Dict[str, Dict[str, int]],
+    win_counts: Mapping[Tuple[str, str], int],
     personas: Iterable[str],
     *,
     max_iterations: int = 500,
@@ -184,33 +282,34 @@ def _compute_bradley_terry_scores(
     personas_list = list(dict.fromkeys(personas))
     if not personas_list:
         return {}, 0, True
+    wins, edges = _matchups(win_counts, personas_list)
+    if len(personas_list) == 1 or not edges:
+        # No matchups to learn from: the uniform start is already the fixed point.
+        uniform = 1.0 / len(personas_list)
+        return {persona: uniform for persona in personas_list}, 0, True
+    if np is not None:
+        return _compute_bradley_terry_scores_numpy(
+            wins, edges, personas_list, max_iterations=max_iterations, tolerance=tolerance
+        )
 
-    prior = 1e-6
     strengths: Dict[str, float] = {
         persona: 1.0 / len(personas_list) for persona in personas_list
     }
 
     for iteration in range(1, max_iterations + 1):
-        updated: Dict[str, float] = {}
-        max_diff = 0.0
+        denominators = dict.fromkeys(personas_list, 0.0)
+        for first, second, total in edges:
+            share = total / (strengths[first] + strengths[second])
+            denominators[first] += share
+            denominators[second] += share
 
+        updated: Dict[str, float] = {}
         for persona in personas_list:
-            wins = sum(win_counts.get(persona, {}).values()) + prior
-            denominator = 0.0
-            for opponent in personas_list:
-                if opponent == persona:
-                    continue
-                total = win_counts.get(persona, {}).get(opponent, 0) + win_counts.get(opponent, {}).get(persona, 0)
-                if total == 0:
-                    continue
-                denominator += total / (strengths[persona] + strengths[opponent])
-
+            denominator = denominators[persona]
             if denominator == 0.0:
-                updated_strength = strengths[persona]
+                updated[persona] = strengths[persona]
             else:
-                updated_strength = wins / denominator
-
-            updated[persona] = updated_strength
+                updated[persona] = wins[persona] / denominator
 
         total_strength = sum(updated.values())
         if total_strength <= 0:
@@ -219,8 +318,10 @@ def _compute_bradley_terry_scores(
             for persona in personas_list:
                 updated[persona] /= total_strength
 
-        for persona in personas_list:
-            max_diff = max(max_diff, abs(updated[persona] - strengths[persona]))
+        max_diff = max(
+            (abs(updated[persona] - strengths[persona]) for persona in personas_list),
+            default=0.0,
+        )
 
         strengths = updated
         if max_diff < tolerance:
@@ -229,6 +330,45 @@ def _compute_bradley_terry_scores(
     return strengths, max_iterations, False
 
 
+def _compute_bradley_terry_scores_numpy(
+    wins_by_persona: Dict[str, float],
+    edges: List[Tuple[str, str, int]],
+    personas_list: List[str],
+    *,
+    max_iterations: int,
+    tolerance: float,
+) -> Tuple[Dict[str, float], int, bool]:
+    """Vectorised form of the MM updates in :func:`_compute_bradley_terry_scores`."""
+
+    size = len(personas_list)
+    position = {persona: index for index, persona in enumerate(personas_list)}
+    first = np.fromiter((position[edge[0]] for edge in edges), dtype=np.intp, count=len(edges))
+    second = np.fromiter((position[edge[1]] for edge in edges), dtype=np.intp, count=len(edges))
+    totals = np.fromiter((edge[2] for edge in edges), dtype=float, count=len(edges))
+    wins = np.fromiter((wins_by_persona[persona] for persona in personas_list), dtype=float)
+    strengths = np.full(size, 1.0 / size)
+
+    for iteration in range(1, max_iterations + 1):
+        shares = totals / (strengths[first] + strengths[second])
+        denominator = np.bincount(first, shares, minlength=size) + np.bincount(
+            second, shares, minlength=size
+        )
+        updated = np.divide(wins, denominator, out=strengths.copy(), where=denominator != 0.0)
+
+        total_strength = updated.sum()
+        if total_strength <= 0:
+            updated = np.full(size, 1.0 / size)
+        else:
+            updated /= total_strength
+
+        max_diff = float(np.abs(updated - strengths).max())
+        strengths = updated
+        if max_diff < tolerance:
+            return dict(zip(personas_list, strengths.tolist())), iteration, True
+
+    return dict(zip(personas_list, strengths.tolist())), max_iterations, False
+
+
 def aggregate_comparison_votes(
     *,
     target_id: Optional[str] = None,
@@ -237,16 +377,45 @@ def aggregate_comparison_votes(
     max_iterations: int = 200,
     tolerance: float = 1e-6,
 ) -> Dict[str, Any]:
-    with STATE_LOCK:
-        state = load_state()
-        votes_raw: List[Dict[str, Any]] = [dict(entry) for entry in state.get("votes", [])]
+    with state_lock("votes"):
+        votes = load_collection("votes")
+        # Votes are append-only, so the count plus the newest id identifies the set.
+        fingerprint = (len(votes), votes[-1].get("id") if votes else None)
 
-    if target_id is not None:
-        votes_raw = [vote for vote in votes_raw if vote.get("target_id") == target_id]
-    if target_kind is not None:
-        votes_raw = [vote for vote in votes_raw if vote.get("target_kind") == target_kind]
-    if adapter is not None:
-        votes_raw = [vote for vote in votes_raw if vote.get("adapter") == adapter]
+    result = _aggregate_votes(
+        fingerprint, target_id, target_kind, adapter, max_iterations, tolerance
+    )
+    return {"rankings": dict(result["rankings"]), "summary": dict(result["summary"])}
+
+
+@lru_cache(maxsize=128)
+def _aggregate_votes(
+    fingerprint: Tuple[int, Optional[str]],
+    target_id: Optional[str],
+    target_kind: Optional[str],
+    adapter: Optional[str],
+    max_iterations: int,
+    tolerance: float,
+) -> Dict[str, Any]:
+    # ``fingerprint`` only keys the cache; callers copy the returned mappings.
+    with state_lock("votes"):
+        votes = load_collection("votes")
+        indexes = _vote_indexes(votes)
+        # Start from the narrowest indexed subset, then filter the rest.
+        candidates: Sequence[Dict[str, Any]] = votes
+        if target_id is not None:
+            candidates = indexes["target_id"].get(target_id, ())
+        if adapter is not None:
+            by_adapter = indexes["adapter"].get(adapter, ())
+            if len(by_adapter) < len(candidates):
+                candidates = by_adapter
+        votes_raw: List[Dict[str, Any]] = [
+            vote
+            for vote in candidates
+            if (target_id is None or vote.get("target_id") == target_id)
+            and (target_kind is None or vote.get("target_kind") == target_kind)
+            and (adapter is None or vote.get("adapter") == adapter)
+        ]
 
     if not votes_raw:
         return {
@@ -264,7 +433,7 @@ def aggregate_comparison_votes(
             },
         }
 
-    win_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    win_counts: Counter[Tuple[str, str]] = Counter()
     personas: set[str] = set()
     pair_ids: set[str] = set()
     last_recorded_at: Optional[str] = None
@@ -276,7 +445,7 @@ def aggregate_comparison_votes(
             continue
         personas.add(str(winner_persona))
         personas.add(str(loser_persona))
-        win_counts[str(winner_persona)][str(loser_persona)] += 1
+        win_counts[str(winner_persona), str(loser_persona)] += 1
         pair_id = vote.get("pair_id")
         if pair_id:
             pair_ids.add(str(pair_id))
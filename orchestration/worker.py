@@ -3,29 +3,47 @@
 from __future__ import annotations
 
 import threading
-import time
-from queue import Empty, Queue
-from typing import Optional
+from queue import Queue
+from typing import List, Optional
 
 from .services.evaluations import EvaluationJobPayload, execute_evaluation_job
 
+# Queued by ``shutdown`` so the blocked worker wakes up and exits.
+_SHUTDOWN_SENTINEL = object()
 
-class EvaluationWorker:
-    """Simple single-threaded worker that processes evaluation jobs sequentially."""
 
-    def __init__(self) -> None:
-        self._queue: "Queue[EvaluationJobPayload]" = Queue()
+class EvaluationWorker:
+    """Pool of worker threads that take evaluation jobs from one FIFO queue.
+
+    A single thread (the default) runs jobs strictly one after another in
+    submission order; larger pools let independent evaluations overlap, so
+    jobs may finish out of order.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._workers = workers
+        self._queue: Queue[EvaluationJobPayload | object] = Queue()
         self._shutdown = threading.Event()
         self._lock = threading.Lock()
-        self._thread: Optional[threading.Thread] = None
+        self._threads: List[threading.Thread] = []
 
     def start(self) -> None:
         with self._lock:
-            if self._thread and self._thread.is_alive():
-                return
+            if any(thread.is_alive() for thread in self._threads):
+                if not self._shutdown.is_set():
+                    return
+                # Let the stopping threads drain up to their sentinels before replacing them.
+                for thread in self._threads:
+                    thread.join()
             self._shutdown.clear()
-            self._thread = threading.Thread(target=self._run, name="evaluation-worker", daemon=True)
-            self._thread.start()
+            self._threads = [
+                threading.Thread(target=self._run, name=f"evaluation-worker-{index}", daemon=True)
+                for index in range(self._workers)
+            ]
+            for thread in self._threads:
+                thread.start()
 
     def submit(self, job: EvaluationJobPayload) -> None:
         self.start()
@@ -34,27 +52,32 @@ class EvaluationWorker:
     def shutdown(self, *, wait: bool = False, timeout: Optional[float] = None) -> None:
         if wait:
             self.wait_for_idle(timeout)
-        self._shutdown.set()
-        thread = self._thread
-        if thread and wait:
-            thread.join(timeout=1.0)
+        with self._lock:
+            threads = [thread for thread in self._threads if thread.is_alive()]
+            if not threads or self._shutdown.is_set():
+                return
+            self._shutdown.set()
+            # One sentinel per thread; each thread exits after taking one.
+            for _ in self._threads:
+                self._queue.put(_SHUTDOWN_SENTINEL)
+        if wait:
+            for thread in threads:
+                thread.join(timeout=1.0)
 
     def wait_for_idle(self, timeout: Optional[float] = None) -> bool:
-        deadline = time.monotonic() + timeout if timeout is not None else None
-        while True:
-            if self._queue.unfinished_tasks == 0:
-                return True
-            if deadline is not None and time.monotonic() >= deadline:
-                return False
-            time.sleep(0.05)
+        # ``task_done`` notifies ``all_tasks_done`` when the count reaches zero.
+        queue = self._queue
+        with queue.all_tasks_done:
+            return queue.all_tasks_done.wait_for(
+                lambda: queue.unfinished_tasks == 0, timeout=timeout
+            )
 
     def _run(self) -> None:
-        while not self._shutdown.is_set():
-            try:
-                job = self._queue.get(timeout=0.1)
-            except Empty:
-                continue
+        while True:
+            job = self._queue.get()
             try:
+                if job is _SHUTDOWN_SENTINEL:
+                    return
                 execute_evaluation_job(job)
             finally:
                 self._queue.task_done()
@@ -64,21 +87,36 @@ def get_evaluation_worker() -> EvaluationWorker:
     """Return the shared evaluation worker instance."""
 
     global _EVALUATION_WORKER
-    if _EVALUATION_WORKER is None:
-        _EVALUATION_WORKER = EvaluationWorker()
-    return _EVALUATION_WORKER
+    worker = _EVALUATION_WORKER
+    if worker is not None:
+        return worker
+    with _WORKER_LOCK:
+        # Re-check: another thread may have created it while we waited.
+        if _EVALUATION_WORKER is None:
+            _EVALUATION_WORKER = EvaluationWorker(workers=_WORKER_COUNT)
+        return _EVALUATION_WORKER
 
 
-def reset_evaluation_worker(wait: bool = True) -> None:
-    """Reset the singleton worker (used in tests)."""
+def reset_evaluation_worker(wait: bool = True, *, workers: int = 1) -> None:
+    """Reset the singleton worker (used in tests).
 
-    global _EVALUATION_WORKER
-    if _EVALUATION_WORKER is not None:
-        _EVALUATION_WORKER.shutdown(wait=wait)
-    _EVALUATION_WORKER = None
+    ``workers`` sizes the pool that ``get_evaluation_worker`` builds next.
+    """
+
+    global _EVALUATION_WORKER, _WORKER_COUNT
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    with _WORKER_LOCK:
+        worker = _EVALUATION_WORKER
+        _EVALUATION_WORKER = None
+        _WORKER_COUNT = workers
+    if worker is not None:
+        worker.shutdown(wait=wait)
 
 
 _EVALUATION_WORKER: Optional[EvaluationWorker] = None
+_WORKER_COUNT = 1
+_WORKER_LOCK = threading.Lock()
 
 
 __all__ = [
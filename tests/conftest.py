@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
-import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import AsyncIterator, Iterator, Mapping
 
+import httpx
 import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from orchestration import catalog, state
+from orchestration.app import create_app
+from orchestration.services.event_stream import reset_event_stream
+from orchestration.worker import reset_evaluation_worker
 
 _ADMIN_KEY = "test-admin-key"
 
@@ -16,8 +26,89 @@ def _set_admin_key(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("PERSONABENCH_ADMIN_KEY", _ADMIN_KEY)
 
 
+@pytest.fixture(scope="session")
+def admin_headers() -> Mapping[str, str]:
+    """Return read-only headers satisfying the admin key check."""
+
+    return MappingProxyType({"x-admin-key": _ADMIN_KEY})
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run ``pytest.mark.anyio`` tests on asyncio, which the SSE routes rely on."""
+
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """Build the orchestration app once; routes keep no state of their own."""
+
+    return create_app()
+
+
+@pytest.fixture()
+def client(app: FastAPI) -> TestClient:
+    """Return a fresh client over the shared app so header changes stay per test."""
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def admin_client(app: FastAPI, admin_headers: Mapping[str, str]) -> TestClient:
+    """Return a shared client that sends the admin key on every request.
+
+    Tests must not change its headers or cookies; use ``client`` for that.
+    """
+
+    return TestClient(app, headers=dict(admin_headers))
+
+
+@pytest.fixture()
+async def admin_async_client(
+    app: FastAPI, admin_headers: Mapping[str, str]
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Return an in-process async client with the admin key, for ``anyio`` tests."""
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver", headers=dict(admin_headers)
+    ) as client:
+        yield client
+
+
 @pytest.fixture()
-def admin_headers() -> dict[str, str]:
-    """Return default headers satisfying the admin key check."""
+def catalog_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point persona and scenario storage at empty per-test directories.
+
+    Tests that write catalog files use this instead of the checked-in examples,
+    so they never touch the repository tree and can run in parallel.
+    """
+
+    monkeypatch.setattr(catalog, "PERSONA_DIR", tmp_path / "personas")
+    monkeypatch.setattr(catalog, "SCENARIO_DIR", tmp_path / "scenarios")
+    catalog.PERSONA_DIR.mkdir()
+    catalog.SCENARIO_DIR.mkdir()
+    catalog.invalidate_persona_cache()
+    catalog.invalidate_scenario_cache()
+    yield tmp_path
+    catalog.invalidate_persona_cache()
+    catalog.invalidate_scenario_cache()
+
+
+@pytest.fixture()
+def reset_orchestration(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Start and finish a test with an idle worker, empty event stream and state.
+
+    The worker runs a single thread unless the test asks for a larger pool with
+    ``@pytest.mark.worker_pool(n)``.
+    """
 
-    return {"x-admin-key": _ADMIN_KEY}
+    marker = request.node.get_closest_marker("worker_pool")
+    reset_evaluation_worker(workers=marker.args[0] if marker else 1)
+    reset_event_stream()
+    state.clear_state()
+    yield
+    reset_evaluation_worker()
+    reset_event_stream()
+    state.clear_state()
@@ -2,8 +2,6 @@
 
 import pytest
 from orchestration import state
-from orchestration.app import create_app
-from fastapi.testclient import TestClient
 
 @pytest.fixture(autouse=True)
 def clear_state_fixture():
@@ -11,11 +9,7 @@ def clear_state_fixture():
     yield
     state.clear_state()
 
-def test_bradley_terry_aggregation_basic(admin_headers):
-    app = create_app()
-    client = TestClient(app)
-    client.headers.update(admin_headers)
-
+def test_bradley_terry_aggregation_basic(admin_client):
     response_a = state.record_evaluation_response(
         run_id="run-a",
         persona_id="cooperative_planner",
@@ -51,7 +45,7 @@ def test_bradley_terry_aggregation_basic(admin_headers):
     state.record_comparison_vote(pair_id=pair_id, winner_slot=slot_coop)
     state.record_comparison_vote(pair_id=pair_id, winner_slot=slot_ruthless)
 
-    agg_resp = client.get("/api/admin/evaluations/aggregate", params={"target": "solitaire-practice"})
+    agg_resp = admin_client.get("/api/admin/evaluations/aggregate", params={"target": "solitaire-practice"})
     assert agg_resp.status_code == 200, agg_resp.text
     result = agg_resp.json()
     rankings = result["rankings"]
@@ -65,12 +59,110 @@ def test_bradley_terry_aggregation_basic(admin_headers):
     assert summary["target_id"] == "solitaire-practice"
     assert summary["converged"] is True
 
-def test_bradley_terry_aggregation_empty(admin_headers):
-    app = create_app()
-    client = TestClient(app)
-    client.headers.update(admin_headers)
-    agg_resp = client.get("/api/admin/evaluations/aggregate", params={"target": "solitaire-practice"})
+def test_bradley_terry_aggregation_empty(admin_client):
+    agg_resp = admin_client.get("/api/admin/evaluations/aggregate", params={"target": "solitaire-practice"})
     assert agg_resp.status_code == 200, agg_resp.text
     result = agg_resp.json()
     assert result["rankings"] == {}
     assert result["summary"]["total_votes"] == 0
+
+def test_bradley_terry_numpy_matches_python(monkeypatch):
+    from orchestration.state import votes
+
+    if votes.np is None:
+        pytest.skip("numpy not installed")
+    win_counts = {
+        ("alpha", "beta"): 3,
+        ("alpha", "gamma"): 1,
+        ("beta", "gamma"): 2,
+        ("gamma", "alpha"): 2,
+    }
+    personas = ["alpha", "beta", "gamma", "idle"]
+
+    vectorised = votes._compute_bradley_terry_scores(win_counts, personas)
+    monkeypatch.setattr(votes, "np", None)
+    reference = votes._compute_bradley_terry_scores(win_counts, personas)
+
+    assert vectorised[1:] == reference[1:]
+    for persona, strength in reference[0].items():
+        assert vectorised[0][persona] == pytest.approx(strength)
+
+def test_bradley_terry_short_circuits_without_matchups():
+    from orchestration.state import votes
+
+    assert votes._compute_bradley_terry_scores({}, ["solo"]) == ({"solo": 1.0}, 0, True)
+    strengths, iterations, converged = votes._compute_bradley_terry_scores(
+        {("alpha", "alpha"): 2}, ["alpha", "beta"]
+    )
+    assert strengths == {"alpha": 0.5, "beta": 0.5}
+    assert (iterations, converged) == (0, True)
+
+def test_aggregation_cache_refreshes_after_new_votes():
+    for persona in ("alpha", "beta"):
+        state.record_evaluation_response(
+            run_id=f"run-{persona}",
+            persona_id=persona,
+            target_id="solitaire-practice",
+            target_kind="scenario",
+            adapter="solitaire",
+            status="completed",
+            summary={},
+        )
+    pair = state.create_comparison_pair(target_id="solitaire-practice")
+
+    state.record_comparison_vote(pair_id=pair["id"], winner_slot="A")
+    first = state.aggregate_comparison_votes(target_id="solitaire-practice")
+    assert state.aggregate_comparison_votes(target_id="solitaire-practice") == first
+
+    state.record_comparison_vote(pair_id=pair["id"], winner_slot="B")
+    second = state.aggregate_comparison_votes(target_id="solitaire-practice")
+    assert first["summary"]["total_votes"] == 1
+    assert second["summary"]["total_votes"] == 2
+
+def test_votes_are_filtered_through_pair_and_target_indexes():
+    pair_ids = {}
+    for target in ("solitaire-practice", "blackjack-basic"):
+        for persona in ("alpha", "beta"):
+            state.record_evaluation_response(
+                run_id=f"run-{persona}-{target}",
+                persona_id=persona,
+                target_id=target,
+                target_kind="scenario",
+                adapter="solitaire",
+                status="completed",
+                summary={},
+            )
+        pair_ids[target] = state.create_comparison_pair(target_id=target)["id"]
+
+    state.record_comparison_vote(pair_id=pair_ids["solitaire-practice"], winner_slot="A")
+    state.record_comparison_vote(pair_id=pair_ids["blackjack-basic"], winner_slot="B")
+    state.record_comparison_vote(pair_id=pair_ids["blackjack-basic"], winner_slot="A")
+
+    listed = state.list_comparison_votes(pair_id=pair_ids["blackjack-basic"])
+    assert [vote["winner_slot"] for vote in listed] == ["A", "B"]
+    assert len(state.list_comparison_votes(pair_id=pair_ids["blackjack-basic"], limit=1)) == 1
+    summary = state.aggregate_comparison_votes(target_id="blackjack-basic", adapter="solitaire")
+    assert summary["summary"]["total_votes"] == 2
+
+def test_vote_history_is_bounded(monkeypatch):
+    from orchestration.state import repository
+
+    monkeypatch.setitem(repository.COLLECTION_LIMITS, "votes", 2)
+    state.clear_state()
+    for persona in ("alpha", "beta"):
+        state.record_evaluation_response(
+            run_id=f"run-{persona}",
+            persona_id=persona,
+            target_id="solitaire-practice",
+            target_kind="scenario",
+            adapter="solitaire",
+            status="completed",
+            summary={},
+        )
+    pair_id = state.create_comparison_pair(target_id="solitaire-practice")["id"]
+
+    for slot in ("A", "B", "B"):
+        state.record_comparison_vote(pair_id=pair_id, winner_slot=slot)
+
+    assert [vote["winner_slot"] for vote in state.list_comparison_votes()] == ["B", "B"]
+    assert state.get_comparison_pair(pair_id)["metadata"]["vote_count"] == 2
@@ -3,63 +3,55 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from typing import Iterator, Mapping
 
+import pytest
 from fastapi.testclient import TestClient
 
-from orchestration.app import create_app
-from orchestration.state import clear_state, enqueue_evaluation, update_queue_entry
+from orchestration.state import clear_state, enqueue_and_finalize
 from orchestration.services.event_stream import get_event_stream, reset_event_stream
 
 
 def _seed_completed_entry() -> dict[str, object]:
-    reset_event_stream()
-    clear_state()
     now = datetime.now(UTC).replace(microsecond=0)
-    entry = enqueue_evaluation(
+    return enqueue_and_finalize(
         persona_id="persona-test",
         target_id="scenario-test",
         target_kind="scenario",
         requested_at=(now - timedelta(minutes=10)).isoformat(),
-    )
-    update_queue_entry(
-        entry["id"],
-        status="running",
         started_at=(now - timedelta(minutes=9)).isoformat(),
-    )
-    update_queue_entry(
-        entry["id"],
-        status="completed",
         completed_at=(now - timedelta(minutes=1)).isoformat(),
         metadata={"run_id": "run-public"},
     )
-    return entry
 
 
-def test_public_queue_endpoint_returns_summary() -> None:
-    entry = _seed_completed_entry()
+@pytest.fixture(scope="module")
+def seeded_entry() -> Iterator[dict[str, object]]:
+    """Seed one completed entry for the whole module; the tests only read it."""
+
+    reset_event_stream()
+    clear_state()
+    yield _seed_completed_entry()
+    clear_state()
+    reset_event_stream()
 
-    app = create_app()
-    client = TestClient(app)
 
+def test_public_queue_endpoint_returns_summary(
+    client: TestClient, seeded_entry: dict[str, object]
+) -> None:
     response = client.get("/api/evaluations/queue")
     assert response.status_code == 200, response.text
     payload = response.json()
 
     assert payload["summary"]["total_entries"] == 1
     assert payload["summary"]["completed_entries"] == 1
-    assert payload["entries"][0]["id"] == entry["id"]
-    assert payload["summary"]["last_completed_entry_id"] == entry["id"]
-
-    clear_state()
-    reset_event_stream()
-
+    assert payload["entries"][0]["id"] == seeded_entry["id"]
+    assert payload["summary"]["last_completed_entry_id"] == seeded_entry["id"]
 
-def test_admin_queue_endpoint_requires_admin(admin_headers: dict[str, str]) -> None:
-    entry = _seed_completed_entry()
-
-    app = create_app()
-    client = TestClient(app)
 
+def test_admin_queue_endpoint_requires_admin(
+    client: TestClient, seeded_entry: dict[str, object], admin_headers: Mapping[str, str]
+) -> None:
     unauthorized = client.get("/api/admin/queue")
     assert unauthorized.status_code == 403
 
@@ -68,52 +60,45 @@ def test_admin_queue_endpoint_requires_admin(admin_headers: dict[str, str]) -> N
     payload = response.json()
 
     assert payload["summary"]["total_entries"] == 1
-    assert payload["summary"]["last_completed_entry_id"] == entry["id"]
+    assert payload["summary"]["last_completed_entry_id"] == seeded_entry["id"]
     assert payload["entries"][0]["persona_id"] == "persona-test"
 
-    clear_state()
-    reset_event_stream()
-
 
-def test_queue_entry_endpoint_supports_etag() -> None:
-    entry = _seed_completed_entry()
-
-    app = create_app()
-    client = TestClient(app)
-
-    first = client.get(f"/api/evaluations/queue/{entry['id']}")
+def test_queue_entry_endpoint_supports_etag(
+    client: TestClient, seeded_entry: dict[str, object]
+) -> None:
+    first = client.head(f"/api/evaluations/queue/{seeded_entry['id']}")
     assert first.status_code == 200, first.text
+    assert first.content == b""
     etag = first.headers.get("ETag")
     assert etag, "expected ETag header on queue entry response"
 
     second = client.get(
-        f"/api/evaluations/queue/{entry['id']}",
+        f"/api/evaluations/queue/{seeded_entry['id']}",
         headers={"If-None-Match": etag},
     )
     assert second.status_code == 304, second.text
 
-    clear_state()
-    reset_event_stream()
-
+    full = client.get(f"/api/evaluations/queue/{seeded_entry['id']}")
+    assert full.headers.get("ETag") == etag
+    assert client.head("/api/evaluations/queue/missing").status_code == 404
 
-def test_queue_event_history_returns_persisted_events() -> None:
-    entry = _seed_completed_entry()
 
+def test_queue_event_history_returns_persisted_events(
+    client: TestClient, seeded_entry: dict[str, object]
+) -> None:
     stream = get_event_stream()
     stream.publish(
-        entry["id"],
+        seeded_entry["id"],
         {
             "type": "status",
             "status": "completed",
             "timestamp": datetime.now(UTC).isoformat(),
-            "queue_entry": entry,
+            "queue_entry": seeded_entry,
         },
     )
 
-    app = create_app()
-    client = TestClient(app)
-
-    response = client.get(f"/api/evaluations/queue/{entry['id']}/events/history")
+    response = client.get(f"/api/evaluations/queue/{seeded_entry['id']}/events/history")
     assert response.status_code == 200, response.text
     payload = response.json()
 
@@ -122,7 +107,4 @@ def test_queue_event_history_returns_persisted_events() -> None:
     event = payload[0]
     assert event["type"] == "status"
     assert event["status"] == "completed"
-    assert event["queue_entry"]["id"] == entry["id"]
-
-    clear_state()
-    reset_event_stream()
+    assert event["queue_entry"]["id"] == seeded_entry["id"]
@@ -3,33 +3,29 @@
 from __future__ import annotations
 
 import json
-import time
 
+import anyio
+import httpx
+import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from orchestration import state
-from orchestration.app import create_app
-from orchestration.services.event_stream import reset_event_stream
-from orchestration.worker import reset_evaluation_worker
+from orchestration.routes.evaluations import evaluation_chain
+from orchestration.services.event_stream import get_event_stream
+
+pytestmark = pytest.mark.usefixtures("reset_orchestration")
 
 
 def _await_queue_completion(entry_id: str, *, timeout: float = 10.0) -> dict[str, object]:
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        entry = state.get_queue_entry(entry_id)
-        if entry and entry.get("status") in {"completed", "failed"}:
-            return entry
-        time.sleep(0.05)
-    raise AssertionError(f"Timed out waiting for queue entry '{entry_id}' to complete")
-
-
-def test_create_evaluation_schedules_background_job(monkeypatch) -> None:
-    reset_evaluation_worker()
-    reset_event_stream()
-    state.clear_state()
-    app = create_app()
-    client = TestClient(app)
+    if get_event_stream().wait_for_terminal(entry_id, timeout=timeout) is None:
+        raise AssertionError(f"Timed out waiting for evaluation '{entry_id}' to complete")
+    entry = state.get_queue_entry(entry_id)
+    assert entry is not None
+    return entry
+
 
+def test_create_evaluation_schedules_background_job(client: TestClient, monkeypatch) -> None:
     def _fake_invoke(payload: dict[str, object]) -> dict[str, object]:
         return {
             "status": "completed",
@@ -39,10 +35,7 @@ def test_create_evaluation_schedules_background_job(monkeypatch) -> None:
             "trace": [],
         }
 
-    monkeypatch.setattr(
-        "orchestration.routes.evaluations.evaluation_chain.invoke",
-        _fake_invoke,
-    )
+    monkeypatch.setattr(evaluation_chain, "invoke", _fake_invoke)
 
     response = client.post(
         "/api/evaluations",
@@ -67,20 +60,10 @@ def test_create_evaluation_schedules_background_job(monkeypatch) -> None:
     assert responses, "expected evaluation response to be persisted"
     assert any(response_item.get("run_id") == details["run_id"] for response_item in responses)
 
-    reset_evaluation_worker()
-    reset_event_stream()
-    state.clear_state()
-
-
-def test_queue_event_stream_provides_lifecycle(monkeypatch) -> None:
-    reset_evaluation_worker()
-    reset_event_stream()
-    state.clear_state()
-    app = create_app()
-    client = TestClient(app)
 
+@pytest.mark.anyio
+async def test_queue_event_stream_provides_lifecycle(app: FastAPI, monkeypatch) -> None:
     def _fake_invoke(payload: dict[str, object]) -> dict[str, object]:
-        time.sleep(0.05)
         return {
             "status": "completed",
             "adapter": "solitaire",
@@ -89,32 +72,38 @@ def test_queue_event_stream_provides_lifecycle(monkeypatch) -> None:
             "trace": [],
         }
 
-    monkeypatch.setattr(
-        "orchestration.routes.evaluations.evaluation_chain.invoke",
-        _fake_invoke,
-    )
-
-    response = client.post(
-        "/api/evaluations",
-        json={
-            "persona": "cooperative_planner",
-            "scenario": "solitaire-practice",
-            "config": {"max_steps": 1},
-        },
-    )
-    assert response.status_code == 202, response.text
-    entry_id = response.json()["details"]["queue_entry_id"]
-
-    events: list[dict[str, object]] = []
-    with client.stream("GET", f"/api/evaluations/queue/{entry_id}/events") as stream:
-        for line in stream.iter_lines():
-            if not line:
-                continue
-            assert line.startswith("data: "), line
-            event = json.loads(line[6:])
-            events.append(event)
-            if event.get("type") in {"result", "error"}:
-                break
+    monkeypatch.setattr(evaluation_chain, "invoke", _fake_invoke)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.post(
+            "/api/evaluations",
+            json={
+                "persona": "cooperative_planner",
+                "scenario": "solitaire-practice",
+                "config": {"max_steps": 1},
+            },
+        )
+        assert response.status_code == 202, response.text
+        entry_id = response.json()["details"]["queue_entry_id"]
+
+        events: list[dict[str, object]] = []
+        with anyio.fail_after(5.0):
+            async with client.stream(
+                "GET", f"/api/evaluations/queue/{entry_id}/events"
+            ) as stream:
+                async for line in stream.aiter_lines():
+                    if not line:
+                        continue
+                    assert line.startswith("data: "), line
+                    event = json.loads(line[6:])
+                    events.append(event)
+                    if event.get("type") in {"result", "error"}:
+                        break
+
+        history_response = await client.get(
+            f"/api/evaluations/queue/{entry_id}/events/history"
+        )
 
     statuses = [event.get("status") for event in events]
     assert statuses[0] == "queued"
@@ -126,13 +115,30 @@ def test_queue_event_stream_provides_lifecycle(monkeypatch) -> None:
         assert isinstance(queue_entry, dict)
         assert queue_entry.get("id") == entry_id
 
-    history_response = client.get(f"/api/evaluations/queue/{entry_id}/events/history")
     assert history_response.status_code == 200, history_response.text
     history = history_response.json()
     assert history, "expected history endpoint to return recorded events"
     assert history[-1]["type"] == events[-1]["type"]
     assert history[0]["status"] == "queued"
 
-    reset_evaluation_worker()
-    reset_event_stream()
-    state.clear_state()
+
+def test_worker_drains_queue_and_stops_on_shutdown(monkeypatch) -> None:
+    from orchestration import worker as worker_module
+
+    processed: list[object] = []
+    monkeypatch.setattr(worker_module, "execute_evaluation_job", processed.append)
+    worker = worker_module.EvaluationWorker()
+    for index in range(3):
+        worker.submit(index)  # type: ignore[arg-type]
+
+    worker.shutdown(wait=True, timeout=5.0)
+
+    assert processed == [0, 1, 2]
+    assert worker._threads and not any(thread.is_alive() for thread in worker._threads)
+
+
+@pytest.mark.worker_pool(3)
+def test_worker_pool_marker_sizes_the_shared_worker() -> None:
+    from orchestration.worker import get_evaluation_worker
+
+    assert get_evaluation_worker()._workers == 3
@@ -15,54 +15,107 @@ from bench.eval.metrics import (
 )
 
 
-def test_success_rate_basic() -> None:
-    metric = success_rate([True, False, True])
-    assert metric.value == 2 / 3
-    assert metric.sample_size == 3
-
-
-def test_steps_over_optimal() -> None:
-    metric = steps_over_optimal([5, 4, 3], [4, 4, 2])
-    assert metric.value == (1 + 0 + 1) / 3
-
-
-def test_compliance_rate() -> None:
-    metric = compliance_rate([False, True, False])
-    assert metric.value == 2 / 3
-
-
-def test_expected_value() -> None:
-    metric = expected_value([1.0, -0.5, 2.5])
-    assert metric.value == pytest.approx(1.0)
-    assert metric.breakdown["sum"] == pytest.approx(3.0)
-
-
-def test_expected_value_empty() -> None:
-    metric = expected_value([])
-    assert metric.value == 0.0
-    assert metric.sample_size == 0
-
-
-def test_cooperation_rate() -> None:
-    metric = cooperation_rate([True, True, False, True])
-    assert metric.value == pytest.approx(0.75)
-    assert metric.sample_size == 4
-
-
-def test_red_flag_rate() -> None:
-    metric = red_flag_rate([False, False, True, True])
-    assert metric.value == pytest.approx(0.5)
-    assert metric.breakdown["flags"] == pytest.approx(2.0)
-
-
-def test_volatility_penalty() -> None:
-    metric = volatility_penalty([1.0, 1.0, 3.0, 5.0])
-    # Population standard deviation of [1,1,3,5] is sqrt(11/4).
-    assert metric.value == pytest.approx((11 / 4) ** 0.5)
-    assert metric.breakdown["mean"] == pytest.approx(2.5)
-
-
-def test_volatility_penalty_empty() -> None:
-    metric = volatility_penalty([])
-    assert metric.value == 0.0
-    assert metric.sample_size == 0
+@pytest.mark.parametrize(
+    ("metric_fn", "args", "value", "sample_size"),
+    [
+        pytest.param(success_rate, ([True, False, True],), 2 / 3, 3, id="success_rate"),
+        pytest.param(
+            steps_over_optimal,
+            ([5, 4, 3], [4, 4, 2]),
+            (1 + 0 + 1) / 3,
+            3,
+            id="steps_over_optimal",
+        ),
+        pytest.param(compliance_rate, ([False, True, False],), 2 / 3, 3, id="compliance_rate"),
+        pytest.param(expected_value, ([1.0, -0.5, 2.5],), 1.0, 3, id="expected_value"),
+        pytest.param(expected_value, ([],), 0.0, 0, id="expected_value_empty"),
+        pytest.param(
+            cooperation_rate,
+            ([True, True, False, True],),
+            0.75,
+            4,
+            id="cooperation_rate",
+        ),
+        pytest.param(red_flag_rate, ([False, False, True, True],), 0.5, 4, id="red_flag_rate"),
+        # Population standard deviation of [1,1,3,5] is sqrt(11/4).
+        pytest.param(
+            volatility_penalty,
+            ([1.0, 1.0, 3.0, 5.0],),
+            (11 / 4) ** 0.5,
+            4,
+            id="volatility_penalty",
+        ),
+        pytest.param(volatility_penalty, ([],), 0.0, 0, id="volatility_penalty_empty"),
+    ],
+)
+def test_metric_value(metric_fn, args, value: float, sample_size: int) -> None:
+    metric = metric_fn(*args)
+    assert metric.value == pytest.approx(value)
+    assert metric.sample_size == sample_size
+
+
+@pytest.mark.parametrize(
+    ("metric_fn", "args", "key", "expected"),
+    [
+        pytest.param(expected_value, ([1.0, -0.5, 2.5],), "sum", 3.0, id="expected_value_sum"),
+        pytest.param(
+            red_flag_rate,
+            ([False, False, True, True],),
+            "flags",
+            2.0,
+            id="red_flag_rate_flags",
+        ),
+        pytest.param(
+            volatility_penalty,
+            ([1.0, 1.0, 3.0, 5.0],),
+            "mean",
+            2.5,
+            id="volatility_penalty_mean",
+        ),
+    ],
+)
+def test_metric_breakdown(metric_fn, args, key: str, expected: float) -> None:
+    assert metric_fn(*args).breakdown[key] == pytest.approx(expected)
+
+
+def test_vectorised_metrics_match_python_reductions(monkeypatch: pytest.MonkeyPatch) -> None:
+    from bench.eval import metrics
+
+    if metrics.np is None:
+        pytest.skip("numpy not installed")
+    rewards = [((index * 37) % 11) / 3 - 1.5 for index in range(1000)]
+    flags = [index % 3 == 0 for index in range(1000)]
+
+    vectorised = (metrics.volatility_penalty(rewards), metrics.red_flag_rate(flags))
+    monkeypatch.setattr(metrics, "np", None)
+    reference = (metrics.volatility_penalty(rewards), metrics.red_flag_rate(flags))
+
+    assert vectorised[0].value == pytest.approx(reference[0].value)
+    assert vectorised[0].breakdown["mean"] == pytest.approx(reference[0].breakdown["mean"])
+    assert vectorised[1] == reference[1]
+
+
+def test_jit_metrics_match_python_reductions(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numba")
+    np = pytest.importorskip("numpy")
+    from bench.eval import metrics
+
+    assert metrics._steps_over_kernel is not None
+    steps = [(index * 7) % 13 for index in range(1000)]
+    optimal = [(index * 5) % 11 for index in range(1000)]
+    rewards = [((index * 37) % 11) / 3 - 1.5 for index in range(1000)]
+
+    jitted = (
+        metrics.steps_over_optimal(np.asarray(steps), np.asarray(optimal)),
+        metrics.volatility_penalty(np.asarray(rewards)),
+    )
+    # Plain lists above an unreachable threshold take the pure-Python loops.
+    monkeypatch.setattr(metrics, "_VECTORIZE_MIN_SIZE", float("inf"))
+    reference = (
+        metrics.steps_over_optimal(steps, optimal),
+        metrics.volatility_penalty(rewards),
+    )
+
+    assert jitted[0].value == pytest.approx(reference[0].value)
+    assert jitted[1].value == pytest.approx(reference[1].value)
+    assert jitted[1].breakdown["mean"] == pytest.approx(reference[1].breakdown["mean"])
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-from fastapi.testclient import TestClient
+from pathlib import Path
 
-from orchestration.app import create_app
+from fastapi.testclient import TestClient
 
+from orchestration import catalog
 
-def test_game_assets_include_manifest_and_adapter() -> None:
-    app = create_app()
-    client = TestClient(app)
 
+def test_game_assets_include_manifest_and_adapter(client: TestClient) -> None:
     response = client.get("/api/games/poker-practice/assets")
     assert response.status_code == 200, response.text
     payload = response.json()
@@ -30,9 +29,15 @@ def test_game_assets_include_manifest_and_adapter() -> None:
     assert payload["rule_pack"] is None
 
 
-def test_game_assets_missing_game_returns_404() -> None:
-    app = create_app()
-    client = TestClient(app)
-
+def test_game_assets_missing_game_returns_404(client: TestClient) -> None:
     response = client.get("/api/games/does-not-exist/assets")
     assert response.status_code == 404
+
+
+def test_asset_text_is_reread_after_the_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.yaml"
+    path.write_text("id: first\n", encoding="utf-8")
+    assert catalog._read_asset_text(path) == "id: first\n"
+
+    path.write_text("id: second, longer\n", encoding="utf-8")
+    assert catalog._read_asset_text(path) == "id: second, longer\n"
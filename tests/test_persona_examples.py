@@ -7,12 +7,22 @@ from pathlib import Path
 
 import pytest
 
-REQUIRED_FIELDS = {"name", "version", "planning_horizon", "risk_tolerance", "tools"}
+REQUIRED_FIELDS = frozenset({"name", "version", "planning_horizon", "risk_tolerance", "tools"})
 
 
-@pytest.mark.parametrize("persona_path", Path("personas/examples").glob("*.json"))
-def test_persona_has_required_fields(persona_path: Path) -> None:
-    with persona_path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    missing = REQUIRED_FIELDS - data.keys()
-    assert not missing, f"Missing required fields: {missing}"
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    # Read each example once at collection; the test body only parses bytes.
+    if "persona_blob" in metafunc.fixturenames:
+        paths = sorted(Path("personas/examples").glob("*.json"))
+        metafunc.parametrize(
+            "persona_blob",
+            [path.read_bytes() for path in paths],
+            ids=[path.name for path in paths],
+        )
+
+
+def test_persona_has_required_fields(persona_blob: bytes) -> None:
+    data = json.loads(persona_blob)
+    assert REQUIRED_FIELDS.issubset(data), (
+        f"Missing required fields: {REQUIRED_FIELDS - data.keys()}"
+    )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from bench.core.api import PersonaAgent
 from bench.core.types import Action, Observation, Plan
 from bench.games.poker.engine import HeadsUpPokerGame
@@ -21,15 +23,12 @@ class PassivePokerAgent(PersonaAgent):
 
     def act(self, plan: Plan, observation: Observation) -> Action:
         del plan
-        legal_moves = list(observation.payload.get("legal_moves", []))
+        legal_moves = observation.payload.get("legal_moves") or ()
         if not legal_moves:
             return Action(command="wait")
-        if "call" in legal_moves:
-            return Action(command="call")
-        if "check" in legal_moves:
-            return Action(command="check")
-        if "bet" in legal_moves:
-            return Action(command="bet")
+        for command in ("call", "check", "bet"):
+            if command in legal_moves:
+                return Action(command=command)
         return Action(command="fold")
 
 
@@ -43,14 +42,22 @@ class InvalidPokerAgent(PassivePokerAgent):
         return super().act(plan, observation)
 
 
-def test_heads_up_poker_match_completes() -> None:
-    game = HeadsUpPokerGame(seed=321)
+@pytest.fixture(scope="module")
+def poker_game() -> HeadsUpPokerGame:
+    """Share one engine across the module; each test reseeds it via ``reset``."""
+
+    return HeadsUpPokerGame(seed=0)
+
+
+@pytest.mark.xdist_group(name="match-poker-completes")
+def test_heads_up_poker_match_completes(poker_game: HeadsUpPokerGame) -> None:
+    poker_game.reset(seed=321)
     agents = {
         "player_button": PassivePokerAgent("Button"),
         "player_big_blind": PassivePokerAgent("Big Blind"),
     }
 
-    runner = MatchRunner(agents, game)
+    runner = MatchRunner(agents, poker_game)
     result = runner.run()
 
     assert result.completed is True
@@ -59,14 +66,15 @@ def test_heads_up_poker_match_completes() -> None:
     assert "stage" in result.status
 
 
-def test_heads_up_poker_invalid_action_penalised() -> None:
-    game = HeadsUpPokerGame(seed=99)
+@pytest.mark.xdist_group(name="match-poker-invalid")
+def test_heads_up_poker_invalid_action_penalised(poker_game: HeadsUpPokerGame) -> None:
+    poker_game.reset(seed=99)
     agents = {
         "player_button": InvalidPokerAgent("Button"),
         "player_big_blind": PassivePokerAgent("Big Blind"),
     }
 
-    runner = MatchRunner(agents, game)
+    runner = MatchRunner(agents, poker_game)
     result = runner.run()
 
     penalties = [turn for turn in result.turns if turn.info.get("invalid")]
@@ -14,6 +14,12 @@ from orchestration.state import (
 )
 
 
+def _iso_offset(base: datetime, seconds: int) -> str:
+    """Return ``base`` minus ``seconds`` as an ISO-8601 string."""
+
+    return (base - timedelta(seconds=seconds)).isoformat()
+
+
 @pytest.fixture(autouse=True)
 def _clear_state() -> None:
     """Ensure queue state is reset before and after each test."""
@@ -28,10 +34,10 @@ def test_summarize_queue_includes_counts_and_metadata() -> None:
 
     now = datetime.now(UTC).replace(microsecond=0)
 
-    oldest_request = (now - timedelta(hours=2)).isoformat()
-    running_request = (now - timedelta(hours=1, minutes=15)).isoformat()
-    completed_request = (now - timedelta(hours=1)).isoformat()
-    failed_request = (now - timedelta(minutes=30)).isoformat()
+    oldest_request = _iso_offset(now, 7200)
+    running_request = _iso_offset(now, 4500)
+    completed_request = _iso_offset(now, 3600)
+    failed_request = _iso_offset(now, 1800)
 
     queued_entry = enqueue_evaluation(
         persona_id="persona-queued",
@@ -49,7 +55,7 @@ def test_summarize_queue_includes_counts_and_metadata() -> None:
     update_queue_entry(
         running_entry["id"],
         status="running",
-        started_at=(now - timedelta(hours=1)).isoformat(),
+        started_at=_iso_offset(now, 3600),
     )
 
     completed_entry = enqueue_evaluation(
@@ -58,8 +64,8 @@ def test_summarize_queue_includes_counts_and_metadata() -> None:
         target_kind="scenario",
         requested_at=completed_request,
     )
-    started_at = (now - timedelta(minutes=20)).isoformat()
-    completed_at = (now - timedelta(minutes=5)).isoformat()
+    started_at = _iso_offset(now, 1200)
+    completed_at = _iso_offset(now, 300)
     update_queue_entry(
         completed_entry["id"],
         status="running",
@@ -80,7 +86,7 @@ def test_summarize_queue_includes_counts_and_metadata() -> None:
     update_queue_entry(
         failed_entry["id"],
         status="failed",
-        completed_at=(now - timedelta(minutes=10)).isoformat(),
+        completed_at=_iso_offset(now, 600),
         error="cancelled",
     )
 
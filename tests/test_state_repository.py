@@ -0,0 +1,415 @@
+"""Tests for the orchestration state write-ahead log and snapshots."""
+
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+
+import pytest
+
+from orchestration.state import (
+    audit,
+    clear_state,
+    create_comparison_pair,
+    enqueue_and_finalize,
+    enqueue_evaluation,
+    get_evaluation_response,
+    get_queue_entry,
+    get_queue_entry_with_etag,
+    list_audit_events,
+    list_comparison_votes,
+    list_evaluation_responses,
+    list_queue_entries,
+    record_audit_event,
+    record_comparison_vote,
+    record_evaluation_response,
+    repository,
+    update_queue_entry,
+    utils,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_state() -> None:
+    clear_state()
+    yield
+    clear_state()
+
+
+def _simulate_restart() -> None:
+    """Drop in-process caches so the next read replays snapshot + log from disk."""
+
+    with repository.state_lock(*repository.COLLECTIONS):
+        repository.sync_records()
+        repository._drop_cache()
+
+
+def test_mutations_append_to_log_and_replay() -> None:
+    entry = enqueue_evaluation(persona_id="persona", target_id="scenario", target_kind="scenario")
+    update_queue_entry(entry["id"], status="running")
+
+    queue_log = repository.STATE_DIR / "queue.log"
+    assert queue_log.exists()
+    assert not (repository.STATE_DIR / "queue.json").exists()
+    assert len(queue_log.read_text(encoding="utf-8").splitlines()) == 2
+
+    _simulate_restart()
+    reloaded = get_queue_entry(entry["id"])
+    assert reloaded is not None
+    assert reloaded["status"] == "running"
+
+
+def test_enqueue_and_finalize_writes_a_single_record() -> None:
+    entry = enqueue_and_finalize(
+        persona_id="persona",
+        target_id="scenario",
+        target_kind="scenario",
+        started_at="2024-05-01T12:00:00+00:00",
+        completed_at="2024-05-01T12:05:00+00:00",
+    )
+
+    queue_log = repository.STATE_DIR / "queue.log"
+    assert len(queue_log.read_text(encoding="utf-8").splitlines()) == 1
+    _simulate_restart()
+    reloaded = get_queue_entry(entry["id"])
+    assert reloaded["status"] == "completed"
+    assert reloaded["completed_at"] == "2024-05-01T12:05:00+00:00"
+
+
+def test_queue_entry_etag_is_cached_until_the_entry_changes() -> None:
+    entry = enqueue_evaluation(persona_id="persona", target_id="scenario", target_kind="scenario")
+
+    _, first = get_queue_entry_with_etag(entry["id"])
+    assert get_queue_entry_with_etag(entry["id"])[1] == first
+
+    update_queue_entry(entry["id"], status="running")
+    reloaded, second = get_queue_entry_with_etag(entry["id"])
+    assert reloaded["status"] == "running"
+    assert second != first
+    assert get_queue_entry_with_etag("missing") is None
+
+
+def test_updates_do_not_mutate_listed_entries() -> None:
+    entry = enqueue_evaluation(persona_id="persona", target_id="scenario", target_kind="scenario")
+    listed = list_queue_entries()[0]
+    snapshot = dict(listed)
+
+    update_queue_entry(entry["id"], status="completed", completed_at="2024-05-01T12:05:00+00:00")
+
+    assert listed == snapshot
+    assert list_queue_entries()[0]["status"] == "completed"
+    assert get_queue_entry(entry["id"])["completed_at"] == "2024-05-01T12:05:00+00:00"
+
+
+def test_returned_entries_do_not_alias_the_cache() -> None:
+    entry = enqueue_evaluation(
+        persona_id="persona", target_id="scenario", target_kind="scenario", metadata={"a": 1}
+    )
+    entry["metadata"]["a"] = 999
+    get_queue_entry(entry["id"])["metadata"]["b"] = 2
+    update_queue_entry(entry["id"], status="running")["metadata"]["c"] = 3
+    get_queue_entry_with_etag(entry["id"])[0]["metadata"]["d"] = 4
+
+    response = record_evaluation_response(
+        run_id="run",
+        persona_id="persona",
+        target_id="scenario",
+        target_kind="scenario",
+        adapter="solitaire",
+        status="completed",
+        summary={"score": 1},
+    )
+    response["summary"]["score"] = 999
+    get_evaluation_response(response["id"])["summary"]["extra"] = True
+
+    assert get_queue_entry(entry["id"])["metadata"] == {"a": 1}
+    assert get_evaluation_response(response["id"])["summary"] == {"score": 1}
+    _simulate_restart()
+    assert get_queue_entry(entry["id"])["metadata"] == {"a": 1}
+
+
+def test_snapshot_truncates_log_and_preserves_state() -> None:
+    entries = [
+        enqueue_evaluation(persona_id=f"persona-{index}", target_id="s", target_kind="scenario")
+        for index in range(3)
+    ]
+
+    repository.snapshot_state()
+
+    assert (repository.STATE_DIR / "queue.json").exists()
+    assert (repository.STATE_DIR / "queue.log").read_text(encoding="utf-8") == ""
+    _simulate_restart()
+    assert [entry["id"] for entry in list_queue_entries()] == [entry["id"] for entry in entries]
+
+
+def test_torn_trailing_record_is_ignored() -> None:
+    kept = enqueue_evaluation(persona_id="kept", target_id="scenario", target_kind="scenario")
+    with (repository.STATE_DIR / "queue.log").open("a", encoding="utf-8") as handle:
+        handle.write('{"collection": "queue", "op": "app')
+
+    _simulate_restart()
+    assert [entry["id"] for entry in list_queue_entries()] == [kept["id"]]
+
+    after = enqueue_evaluation(persona_id="after", target_id="scenario", target_kind="scenario")
+    _simulate_restart()
+    assert [entry["id"] for entry in list_queue_entries()] == [kept["id"], after["id"]]
+
+
+def test_audit_events_append_to_their_own_file() -> None:
+    for index in range(3):
+        record_audit_event(actor="tester", action="probe", subject=str(index), status="ok")
+
+    audit.flush_audit_events()
+    assert len(repository.AUDIT_PATH.read_bytes().splitlines()) == 3
+    assert not any(repository.STATE_DIR.glob("*.log"))
+    assert [event["subject"] for event in list_audit_events(limit=2)] == ["1", "2"]
+
+
+def test_audit_tail_reads_across_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(audit, "_TAIL_CHUNK_SIZE", 16)
+    for index in range(20):
+        record_audit_event(actor="tester", action="probe", subject=str(index), status="ok")
+
+    assert [event["subject"] for event in list_audit_events(limit=3)] == ["17", "18", "19"]
+    assert len(list_audit_events()) == 20
+
+
+def test_disabled_audit_skips_persistence(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(audit, "_AUDIT_ENABLED", False)
+
+    event = record_audit_event(actor="tester", action="probe", subject="quiet", status="ok")
+
+    assert event["subject"] == "quiet"
+    assert not repository.AUDIT_PATH.exists()
+    assert list_audit_events() == []
+
+
+def test_concurrent_writers_are_all_persisted() -> None:
+    def _record(index: int) -> None:
+        record_audit_event(actor="tester", action="burst", subject=str(index), status="ok")
+
+    threads = [threading.Thread(target=_record, args=(index,)) for index in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    _simulate_restart()
+    subjects = {event["subject"] for event in list_audit_events()}
+    assert subjects == {str(index) for index in range(16)}
+
+
+def test_bounded_collections_evict_oldest(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(repository.COLLECTION_LIMITS, "audit", 3)
+    clear_state()
+
+    for index in range(5):
+        record_audit_event(actor="tester", action="probe", subject=str(index), status="ok")
+
+    assert [event["subject"] for event in list_audit_events()] == ["2", "3", "4"]
+    assert len(repository.AUDIT_PATH.read_bytes().splitlines()) <= 2 * 3
+
+
+def test_queue_index_tracks_updates_and_evictions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(repository.COLLECTION_LIMITS, "queue", 2)
+    clear_state()
+
+    first = enqueue_evaluation(persona_id="p1", target_id="s", target_kind="scenario")
+    second = enqueue_evaluation(persona_id="p2", target_id="s", target_kind="scenario")
+    update_queue_entry(second["id"], status="running")
+    third = enqueue_evaluation(persona_id="p3", target_id="s", target_kind="scenario")
+
+    assert get_queue_entry(first["id"]) is None
+    assert get_queue_entry(second["id"])["status"] == "running"
+    assert get_queue_entry(third["id"])["status"] == "queued"
+    with pytest.raises(KeyError):
+        update_queue_entry(first["id"], status="failed")
+
+
+def test_create_comparison_pair_pairs_distinct_personas_on_same_target() -> None:
+    def _response(persona: str, target: str) -> dict[str, object]:
+        return record_evaluation_response(
+            run_id=f"run-{persona}-{target}",
+            persona_id=persona,
+            target_id=target,
+            target_kind="scenario",
+            adapter="solitaire",
+            status="completed",
+            summary={},
+        )
+
+    _response("alpha", "other")
+    older = _response("alpha", "shared")
+    _response("alpha", "shared")
+    _response("beta", "other-2")
+    newest = _response("beta", "shared")
+
+    pair = create_comparison_pair(target_id="shared")
+    paired_ids = {entry["response_id"] for entry in pair["responses"]}
+    assert newest["id"] in paired_ids
+    assert older["id"] not in paired_ids
+    assert pair["target_id"] == "shared"
+
+
+def test_mutations_only_touch_their_own_partition() -> None:
+    enqueue_evaluation(persona_id="persona", target_id="scenario", target_kind="scenario")
+
+    assert (repository.STATE_DIR / "queue.log").exists()
+    for name in ("responses", "pairs", "votes"):
+        assert not (repository.STATE_DIR / f"{name}.log").exists()
+        assert not (repository.STATE_DIR / f"{name}.json").exists()
+
+
+def test_legacy_single_file_snapshot_seeds_partitions() -> None:
+    repository.STATE_DIR.mkdir(parents=True, exist_ok=True)
+    legacy_entry = {
+        "id": "legacy",
+        "persona_id": "p",
+        "target_id": "s",
+        "target_kind": "scenario",
+        "status": "queued",
+    }
+    legacy_state = {"queue": [legacy_entry], "audit": []}
+    repository.LEGACY_STATE_PATH.write_bytes(repository._dumps(legacy_state))
+
+    _simulate_restart()
+    assert get_queue_entry("legacy")["status"] == "queued"
+
+    update_queue_entry("legacy", status="running")
+    repository.snapshot_state()
+    repository.LEGACY_STATE_PATH.unlink()
+    _simulate_restart()
+    assert get_queue_entry("legacy")["status"] == "running"
+
+
+def test_legacy_snapshot_audit_trail_is_migrated() -> None:
+    repository.STATE_DIR.mkdir(parents=True, exist_ok=True)
+    legacy_events = [
+        {"id": f"event-{index}", "actor": "tester", "action": "probe", "subject": str(index)}
+        for index in range(3)
+    ]
+    repository.LEGACY_STATE_PATH.write_bytes(repository._dumps({"audit": legacy_events}))
+
+    record_audit_event(actor="tester", action="probe", subject="new", status="ok")
+
+    subjects = [event["subject"] for event in list_audit_events()]
+    assert subjects == ["0", "1", "2", "new"]
+    assert len(repository.AUDIT_PATH.read_bytes().splitlines()) == 4
+
+
+def test_normalize_for_storage_converts_containers_and_datetimes() -> None:
+    value = {
+        "when": datetime(2024, 5, 1, 12, 30, tzinfo=UTC),
+        "nested": {"moves": ("a", "b"), "seen": [datetime(2024, 5, 1)]},
+        "raw": b"bytes",
+    }
+
+    assert utils.normalize_for_storage(value) == {
+        "when": "2024-05-01T12:30:00+00:00",
+        "nested": {"moves": ["a", "b"], "seen": ["2024-05-01T00:00:00"]},
+        "raw": b"bytes",
+    }
+
+
+class _Colour(Enum):
+    RED = "red"
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+def test_normalize_for_storage_keeps_non_json_leaves() -> None:
+    point = _Point(1)
+
+    stored = utils.normalize_for_storage(
+        {"nan": math.nan, "ints": {1: "x"}, "colour": _Colour.RED, "point": point}
+    )
+
+    assert math.isnan(stored["nan"])
+    assert stored["ints"] == {1: "x"}
+    assert stored["colour"] is _Colour.RED
+    assert stored["point"] is point
+
+
+def test_response_groups_follow_appends_and_evictions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(repository.COLLECTION_LIMITS, "responses", 2)
+    clear_state()
+
+    recorded = [
+        record_evaluation_response(
+            run_id=f"run-{index}",
+            persona_id=f"persona-{index}",
+            target_id="shared",
+            target_kind="scenario",
+            adapter="solitaire",
+            status="completed",
+            summary={},
+        )
+        for index in range(3)
+    ]
+
+    with repository.state_lock("responses"):
+        grouped = repository.grouped_entries("responses", "shared", "scenario", "completed")
+        wildcard = repository.grouped_entries("responses", None, "scenario", None)
+    assert [entry["id"] for entry in grouped] == [entry["id"] for entry in recorded[1:]]
+    assert [entry["id"] for entry in wildcard] == [entry["id"] for entry in recorded[1:]]
+
+
+def test_fully_keyed_response_filter_matches_scan() -> None:
+    recorded = [
+        record_evaluation_response(
+            run_id=f"run-{index}",
+            persona_id=("alpha", "beta")[index % 2],
+            target_id=("shared", "other")[index % 3 == 0],
+            target_kind="scenario",
+            adapter="solitaire",
+            status=("completed", "failed")[index % 5 == 0],
+            summary={},
+        )
+        for index in range(12)
+    ]
+
+    listed = list_evaluation_responses(
+        persona_id="alpha", target_id="shared", target_kind="scenario", status="completed"
+    )
+    expected = [
+        entry
+        for entry in reversed(recorded)
+        if entry["persona_id"] == "alpha"
+        and entry["target_id"] == "shared"
+        and entry["status"] == "completed"
+    ]
+    assert [entry["id"] for entry in listed] == [entry["id"] for entry in expected]
+    assert expected
+
+
+def test_votes_append_to_their_log_and_replay() -> None:
+    for persona in ("alpha", "beta"):
+        record_evaluation_response(
+            run_id=f"run-{persona}",
+            persona_id=persona,
+            target_id="shared",
+            target_kind="scenario",
+            adapter="solitaire",
+            status="completed",
+            summary={},
+        )
+    pair = create_comparison_pair(target_id="shared")
+    recorded = [record_comparison_vote(pair_id=pair["id"], winner_slot="A") for _ in range(5)]
+
+    votes_log = repository.STATE_DIR / "votes.log"
+    assert len(votes_log.read_text(encoding="utf-8").splitlines()) == 5
+    assert not (repository.STATE_DIR / "votes.json").exists()
+    _simulate_restart()
+    assert [vote["id"] for vote in list_comparison_votes()] == [
+        vote["id"] for vote in reversed(recorded)
+    ]
+
+    repository.flush_state()
+    assert (repository.STATE_DIR / "votes.json").exists()
+    assert not votes_log.exists() or votes_log.read_text(encoding="utf-8") == ""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Optional
 
 from bench.core.types import Action, Observation, Plan
 from bench.core.api import PersonaAgent
@@ -18,14 +18,14 @@ class FirstAvailableAgent(PersonaAgent):
         self.name = label
 
     def plan(self, observation: Observation) -> Plan:
-        moves = _legal_moves(observation)
-        step = f"play {moves[0]}" if moves else "wait"
+        move = _first_legal(observation)
+        step = f"play {move}" if move is not None else "wait"
         return Plan(rationale="Select first open cell", steps=[step])
 
     def act(self, plan: Plan, observation: Observation) -> Action:
         del plan
-        moves = _legal_moves(observation)
-        command = str(moves[0]) if moves else "noop"
+        move = _first_legal(observation)
+        command = str(move) if move is not None else "noop"
         return Action(command=command)
 
 
@@ -43,9 +43,8 @@ class InvalidThenGreedyAgent(FirstAvailableAgent):
         return super().act(plan, observation)
 
 
-def _legal_moves(observation: Observation) -> List[str]:
-    moves = observation.payload.get("legal_moves", [])
-    return [str(move) for move in moves]
+def _first_legal(observation: Observation) -> Optional[Any]:
+    return next(iter(observation.payload.get("legal_moves", ())), None)
 
 
 def test_tic_tac_toe_match_completes() -> None:
@@ -10,10 +10,12 @@ from bench.core.logging import TraceLogger
 from bench.core.types import Action, Observation, Plan, Reaction, StepResult, Event
 
 
+def _read_records(buffer: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in buffer.getvalue().splitlines() if line]
+
+
 def _strip_timestamps(record: dict) -> dict:
-    record = dict(record)
-    record.pop("timestamp", None)
-    return record
+    return {key: value for key, value in record.items() if key != "timestamp"}
 
 
 def test_trace_logger_context_and_tool_summary() -> None:
@@ -41,7 +43,7 @@ def test_trace_logger_context_and_tool_summary() -> None:
     )
     logger.log_tool_summary()
 
-    records = [json.loads(line) for line in buffer.getvalue().strip().splitlines()]
+    records = _read_records(buffer)
     assert records[0]["event"] == "context"
     assert records[0]["run_id"] == "run-123"
     assert records[0]["evaluation"] == "eval-456"
@@ -72,7 +74,7 @@ def test_trace_logger_step_result_contains_events() -> None:
     logger.log_step_result("agent", step_result)
     logger.log_reaction("agent", Reaction(adjustment="noop"))
 
-    records = [json.loads(line) for line in buffer.getvalue().strip().splitlines()]
+    records = _read_records(buffer)
     step_record = _strip_timestamps(records[0])
     assert step_record["event"] == "step_result"
     assert step_record["payload"]["observation"]["payload"] == {"state": "s"}